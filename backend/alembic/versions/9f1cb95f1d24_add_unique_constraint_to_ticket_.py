@@ -15,28 +15,61 @@ down_revision = 'c08085465bad'
 branch_labels = None
 depends_on = None
 
+# CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block;
+# the autocommit_block() wrappers below step outside Alembic's
+# transactional DDL for exactly those statements.
+
+
+def _drop_invalid_index(index_name: str) -> None:
+    """Drop a leftover INVALID index from a failed concurrent build.
+
+    A concurrent index build that fails partway leaves an INVALID index
+    behind, which would make a retry of this migration error out.
+    """
+    invalid = op.get_bind().execute(
+        sa.text(
+            "SELECT relname FROM pg_class c "
+            "JOIN pg_index i ON i.indexrelid = c.oid "
+            "WHERE i.indisvalid = false AND c.relname = :name"
+        ),
+        {"name": index_name},
+    ).first()
+    if invalid:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+
 
 def upgrade() -> None:
-    # Drop the old non-unique index
-    op.drop_index('ix_tickets_tenant_external', table_name='tickets')
-
-    # Create a unique index on (tenant_id, external_id)
-    op.create_index(
-        'ix_tickets_tenant_external',
-        'tickets',
-        ['tenant_id', 'external_id'],
-        unique=True
+    with op.get_context().autocommit_block():
+        _drop_invalid_index("ix_tickets_tenant_external_new")
+
+        # Concurrent builds must wait for conflicting locks rather than fail,
+        # so disable any lock_timeout for the duration of the build
+        op.execute("SET lock_timeout = 0")
+
+        # Build the unique index concurrently under a temporary name so the
+        # old index keeps serving queries while the new one builds
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY ix_tickets_tenant_external_new "
+            "ON tickets (tenant_id, external_id)"
+        )
+
+        op.execute("RESET lock_timeout")
+
+    # Swapping the old index for the new one is a pure catalog update
+    op.execute("DROP INDEX ix_tickets_tenant_external")
+    op.execute(
+        "ALTER INDEX ix_tickets_tenant_external_new "
+        "RENAME TO ix_tickets_tenant_external"
     )
 
 
 def downgrade() -> None:
-    # Drop the unique index
-    op.drop_index('ix_tickets_tenant_external', table_name='tickets')
-
-    # Recreate the old non-unique index
-    op.create_index(
-        'ix_tickets_tenant_external',
-        'tickets',
-        ['tenant_id', 'external_id'],
-        unique=False
-    )
+    with op.get_context().autocommit_block():
+        # Drop the unique index
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tickets_tenant_external")
+
+        # Recreate the old non-unique index
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_tickets_tenant_external "
+            "ON tickets (tenant_id, external_id)"
+        )
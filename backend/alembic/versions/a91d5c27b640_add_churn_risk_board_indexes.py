@@ -0,0 +1,56 @@
+"""add churn risk board covering and partial indexes
+
+Revision ID: a91d5c27b640
+Revises: f3a9c14d08e2
+Create Date: 2026-08-26 15:02:18.730551
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'a91d5c27b640'
+down_revision = 'f3a9c14d08e2'
+branch_labels = None
+depends_on = None
+
+
+def _create_indexes(concurrently: bool) -> None:
+    kwargs = {'postgresql_concurrently': True} if concurrently else {}
+    op.create_index(
+        'ix_churn_risks_board',
+        'churn_risk_cards',
+        ['tenant_id', 'status', sa.text('created_at DESC')],
+        postgresql_include=['owner_id', 'trigger_type', 'company_id'],
+        **kwargs,
+    )
+    op.create_index(
+        'ix_churn_risks_owner_open',
+        'churn_risk_cards',
+        ['tenant_id', 'owner_id'],
+        postgresql_where=sa.text("status <> 'completed'"),
+        **kwargs,
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        # CONCURRENTLY avoids blocking writes but cannot run inside the
+        # migration transaction
+        with op.get_context().autocommit_block():
+            op.drop_index('ix_churn_risks_tenant_status', table_name='churn_risk_cards')
+            _create_indexes(concurrently=True)
+    else:
+        op.drop_index('ix_churn_risks_tenant_status', table_name='churn_risk_cards')
+        _create_indexes(concurrently=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_churn_risks_owner_open', table_name='churn_risk_cards')
+    op.drop_index('ix_churn_risks_board', table_name='churn_risk_cards')
+    op.create_index(
+        'ix_churn_risks_tenant_status',
+        'churn_risk_cards',
+        ['tenant_id', 'status', 'created_at'],
+    )
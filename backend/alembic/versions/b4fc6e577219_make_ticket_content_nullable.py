@@ -17,14 +17,38 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Make ticket content nullable (some HubSpot tickets have no content)
-    op.alter_column('tickets', 'content',
-               existing_type=sa.TEXT(),
-               nullable=True)
+    # Make ticket content nullable (some HubSpot tickets have no content).
+    # batch_alter_table is a plain ALTER on PostgreSQL but lets SQLite
+    # (used in tests) do its table-copy in a single pass.
+    with op.batch_alter_table('tickets') as batch_op:
+        batch_op.alter_column('content',
+                   existing_type=sa.TEXT(),
+                   nullable=True)
 
 
 def downgrade() -> None:
+    # Backfill NULL content in bounded batches. This caps per-statement
+    # work and undo volume; it does NOT release locks early - everything
+    # here runs in the one migration transaction, so each batch's row
+    # locks are held until the downgrade commits.
+    bind = op.get_bind()
+    while True:
+        result = bind.execute(sa.text(
+            "UPDATE tickets SET content = '' WHERE id IN ("
+            "  SELECT id FROM tickets WHERE content IS NULL LIMIT 1000"
+            ")"
+        ))
+        if result.rowcount == 0:
+            break
+
+    # Fail fast instead of queueing behind long transactions while waiting
+    # for the ACCESS EXCLUSIVE lock the NOT NULL validation scan needs
+    op.execute("SET lock_timeout = '2s'")
+
     # Revert ticket content back to non-nullable
-    op.alter_column('tickets', 'content',
-               existing_type=sa.TEXT(),
-               nullable=False)
+    with op.batch_alter_table('tickets') as batch_op:
+        batch_op.alter_column('content',
+                   existing_type=sa.TEXT(),
+                   nullable=False)
+
+    op.execute("RESET lock_timeout")
@@ -0,0 +1,41 @@
+"""add GIN index for ticket source_metadata containment filters
+
+Revision ID: b82f41c9a557
+Revises: d57e6b901f23
+Create Date: 2026-08-26 16:20:31.287664
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'b82f41c9a557'
+down_revision = 'd57e6b901f23'
+branch_labels = None
+depends_on = None
+
+
+def _create(concurrently: bool) -> None:
+    kwargs = {'postgresql_concurrently': True} if concurrently else {}
+    op.create_index(
+        'ix_tickets_source_metadata_gin',
+        'tickets',
+        ['source_metadata'],
+        postgresql_using='gin',
+        postgresql_ops={'source_metadata': 'jsonb_path_ops'},
+        **kwargs,
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        # CONCURRENTLY avoids blocking writes but cannot run inside the
+        # migration transaction
+        with op.get_context().autocommit_block():
+            _create(concurrently=True)
+    else:
+        _create(concurrently=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tickets_source_metadata_gin', table_name='tickets')
@@ -0,0 +1,41 @@
+"""add GIN index for company crm_metadata containment filters
+
+Revision ID: c4e8d20a913b
+Revises: b82f41c9a557
+Create Date: 2026-08-26 16:44:09.552178
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'c4e8d20a913b'
+down_revision = 'b82f41c9a557'
+branch_labels = None
+depends_on = None
+
+
+def _create(concurrently: bool) -> None:
+    kwargs = {'postgresql_concurrently': True} if concurrently else {}
+    op.create_index(
+        'ix_companies_crm_metadata_gin',
+        'companies',
+        ['crm_metadata'],
+        postgresql_using='gin',
+        postgresql_ops={'crm_metadata': 'jsonb_path_ops'},
+        **kwargs,
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        # CONCURRENTLY avoids blocking writes but cannot run inside the
+        # migration transaction
+        with op.get_context().autocommit_block():
+            _create(concurrently=True)
+    else:
+        _create(concurrently=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_companies_crm_metadata_gin', table_name='companies')
@@ -0,0 +1,45 @@
+"""convert comment mentions to jsonb with a containment GIN index
+
+Revision ID: d57e6b901f23
+Revises: a91d5c27b640
+Create Date: 2026-08-26 15:40:55.913477
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'd57e6b901f23'
+down_revision = 'a91d5c27b640'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        # SQLite stores JSON as text already; nothing to convert
+        return
+    # to_jsonb turns uuid[] into a jsonb array of uuid strings, matching
+    # what the model now writes
+    op.execute(
+        "ALTER TABLE churn_risk_comments "
+        "ALTER COLUMN mentions TYPE jsonb USING to_jsonb(mentions)"
+    )
+    op.create_index(
+        'ix_comments_mentions',
+        'churn_risk_comments',
+        ['mentions'],
+        postgresql_using='gin',
+        postgresql_ops={'mentions': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_comments_mentions', table_name='churn_risk_comments')
+    op.execute(
+        "ALTER TABLE churn_risk_comments "
+        "ALTER COLUMN mentions TYPE uuid[] USING "
+        "ARRAY(SELECT jsonb_array_elements_text(mentions))::uuid[]"
+    )
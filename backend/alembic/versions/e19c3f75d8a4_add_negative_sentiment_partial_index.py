@@ -0,0 +1,41 @@
+"""add partial index for negative-sentiment dashboard queries
+
+Revision ID: e19c3f75d8a4
+Revises: c4e8d20a913b
+Create Date: 2026-08-26 17:03:50.660912
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'e19c3f75d8a4'
+down_revision = 'c4e8d20a913b'
+branch_labels = None
+depends_on = None
+
+
+def _create(concurrently: bool) -> None:
+    kwargs = {'postgresql_concurrently': True} if concurrently else {}
+    op.create_index(
+        'ix_tickets_negative_sentiment',
+        'tickets',
+        ['tenant_id', sa.text('created_at DESC')],
+        postgresql_where=sa.text("sentiment_score IN ('NEGATIVE', 'VERY_NEGATIVE')"),
+        **kwargs,
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        # CONCURRENTLY avoids blocking writes but cannot run inside the
+        # migration transaction
+        with op.get_context().autocommit_block():
+            _create(concurrently=True)
+    else:
+        _create(concurrently=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tickets_negative_sentiment', table_name='tickets')
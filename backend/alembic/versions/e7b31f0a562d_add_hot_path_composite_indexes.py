@@ -0,0 +1,41 @@
+"""add hot path composite indexes
+
+Revision ID: e7b31f0a562d
+Revises: b4fc6e577219
+Create Date: 2026-08-26 10:12:45.102938
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'e7b31f0a562d'
+down_revision = 'b4fc6e577219'
+branch_labels = None
+depends_on = None
+
+# (tenant_id, type) serves the OAuth callback / delete lookups;
+# (tenant_id, created_at DESC) serves list_tickets pagination without a sort
+_INDEXES = [
+    ('ix_integrations_tenant_type', 'integrations', ['tenant_id', 'type']),
+    ('ix_tickets_tenant_created_desc', 'tickets', ['tenant_id', sa.text('created_at DESC')]),
+]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        # CONCURRENTLY avoids blocking writes but cannot run inside the
+        # migration transaction
+        with op.get_context().autocommit_block():
+            for name, table, columns in _INDEXES:
+                op.create_index(name, table, columns, postgresql_concurrently=True)
+    else:
+        # SQLite (tests) takes the plain path
+        for name, table, columns in _INDEXES:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _columns in _INDEXES:
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,41 @@
+"""store churn risk enum values instead of names
+
+Revision ID: f3a9c14d08e2
+Revises: e7b31f0a562d
+Create Date: 2026-08-26 14:31:02.448210
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'f3a9c14d08e2'
+down_revision = 'e7b31f0a562d'
+branch_labels = None
+depends_on = None
+
+# (enum type, old Python-name label, new value label)
+_RENAMES = [
+    ("triggertype", "FRUSTRATED", "frustrated"),
+    ("triggertype", "SIGNIFICANT_SUPPORT", "significant_support"),
+    ("triggertype", "SILENTLY_STRUGGLING", "silently_struggling"),
+    ("churnriskstatus", "NEW", "new"),
+    ("churnriskstatus", "WORKING", "working"),
+    ("churnriskstatus", "WAITING", "waiting"),
+    ("churnriskstatus", "COMPLETED", "completed"),
+]
+
+
+def upgrade() -> None:
+    # The models now map these enums with values_callable, so the database
+    # labels must match the Python enum values rather than the member names.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for enum_type, old, new in _RENAMES:
+        op.execute(f"ALTER TYPE {enum_type} RENAME VALUE '{old}' TO '{new}'")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for enum_type, old, new in _RENAMES:
+        op.execute(f"ALTER TYPE {enum_type} RENAME VALUE '{new}' TO '{old}'")
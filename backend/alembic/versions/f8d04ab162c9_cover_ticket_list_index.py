@@ -0,0 +1,45 @@
+"""rebuild ticket list index with INCLUDE columns
+
+Revision ID: f8d04ab162c9
+Revises: e19c3f75d8a4
+Create Date: 2026-08-26 17:22:14.094316
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'f8d04ab162c9'
+down_revision = 'e19c3f75d8a4'
+branch_labels = None
+depends_on = None
+
+_INCLUDE = ['subject', 'sentiment_score', 'priority', 'company_id']
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        # CONCURRENTLY avoids blocking writes but cannot run inside the
+        # migration transaction
+        with op.get_context().autocommit_block():
+            op.drop_index('ix_tickets_tenant_created_desc', table_name='tickets')
+            op.create_index(
+                'ix_tickets_tenant_created_desc',
+                'tickets',
+                ['tenant_id', sa.text('created_at DESC')],
+                postgresql_include=_INCLUDE,
+                postgresql_concurrently=True,
+            )
+    # On SQLite the existing index is unchanged; INCLUDE is Postgres-only
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.drop_index('ix_tickets_tenant_created_desc', table_name='tickets')
+        op.create_index(
+            'ix_tickets_tenant_created_desc',
+            'tickets',
+            ['tenant_id', sa.text('created_at DESC')],
+        )
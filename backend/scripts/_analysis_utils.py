@@ -0,0 +1,152 @@
+"""Shared helpers for the ticket fetch-and-analyze scripts.
+
+The fetch scripts all analyze a batch of HubSpot tickets with the same
+pattern; this module holds the common concurrent-analysis logic so each
+script doesn't reimplement (and serialize) the OpenRouter calls.
+"""
+
+import asyncio
+import hashlib
+
+from scripts._llm_cache import cache_analysis, get_cached_analysis
+
+# Sentiment analysis is network-bound, so a modest concurrency cap keeps us
+# under OpenRouter rate limits while still overlapping round-trips
+ANALYSIS_CONCURRENCY = 8
+
+# Tickets whose combined subject+content is shorter than this carry almost
+# no sentiment signal and aren't worth a paid LLM call
+MIN_ANALYZABLE_CHARS = 20
+
+
+async def iter_ticket_pages(client, total, properties=None):
+    """Yield pages of HubSpot tickets, prefetching the next page.
+
+    After each response the next page's request is started immediately (via
+    `asyncio.create_task`) before the current page is yielded, so network
+    fetch for page N+1 overlaps with whatever the caller does with page N.
+    """
+    fetch = asyncio.create_task(
+        client.get_tickets(limit=min(total, 100), properties=properties)
+    )
+    fetched = 0
+
+    while fetch is not None:
+        response = await fetch
+        results = response.get("results", [])
+        fetched += len(results)
+
+        cursor = response.get("paging", {}).get("next", {}).get("after")
+        if cursor and fetched < total and results:
+            fetch = asyncio.create_task(
+                client.get_tickets(
+                    limit=min(total - fetched, 100),
+                    after=cursor,
+                    properties=properties
+                )
+            )
+        else:
+            fetch = None
+
+        yield results
+
+
+async def fetch_tickets_paginated(client, total, properties=None):
+    """Fetch up to `total` tickets, paging with prefetch overlap."""
+    tickets = []
+    async for page in iter_ticket_pages(client, total, properties=properties):
+        tickets.extend(page)
+    return tickets
+
+
+async def analyze_tickets_concurrently(analyzer, tickets, concurrency=ANALYSIS_CONCURRENCY):
+    """Analyze a batch of HubSpot tickets concurrently.
+
+    Runs `analyzer.analyze_ticket` for every ticket under a bounded semaphore
+    so the batch pays ~max(latency) instead of sum(latency). Returns one
+    result dict per ticket, in input order; failures are captured per-ticket
+    with `sentiment: "error"` rather than aborting the batch.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def run(full_text):
+        cached = get_cached_analysis(full_text)
+        if cached is not None:
+            return cached
+
+        async with sem:
+            analysis = await analyzer.analyze_ticket(
+                ticket_content=full_text,
+                available_topics=None
+            )
+
+        cache_analysis(full_text, analysis)
+        return analysis
+
+    # One analysis task per distinct content hash: empty/trivial tickets are
+    # skipped entirely and duplicate (subject, content) pairs within the
+    # batch share a single LLM call
+    texts = []
+    tasks = {}
+    for ticket in tickets:
+        properties = ticket.get("properties", {})
+        subject = properties.get("subject", "No subject")
+        content = properties.get("content", "")
+
+        # Combine subject and content for analysis
+        full_text = f"{subject}\n\n{content}" if content else subject
+        texts.append(full_text)
+
+        if len(full_text.strip()) < MIN_ANALYZABLE_CHARS:
+            continue
+
+        key = hashlib.blake2b(full_text.encode(), digest_size=16).digest()
+        if key not in tasks:
+            tasks[key] = asyncio.ensure_future(run(full_text))
+
+    if tasks:
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    results = []
+    for ticket, full_text in zip(tickets, texts):
+        ticket_id = ticket.get("id")
+        subject = ticket.get("properties", {}).get("subject", "No subject")
+
+        if len(full_text.strip()) < MIN_ANALYZABLE_CHARS:
+            # Not enough text to analyze; classify locally as neutral
+            results.append({
+                "ticket_id": ticket_id,
+                "subject": subject,
+                "sentiment": "neutral",
+                "confidence": 0.0,
+                "is_negative": False,
+                "skipped": True
+            })
+            continue
+
+        task = tasks[hashlib.blake2b(full_text.encode(), digest_size=16).digest()]
+        analysis = task.exception() if task.exception() is not None else task.result()
+
+        if isinstance(analysis, Exception):
+            results.append({
+                "ticket_id": ticket_id,
+                "subject": subject,
+                "sentiment": "error",
+                "confidence": 0.0,
+                "is_negative": False,
+                "error": str(analysis)
+            })
+            continue
+
+        sentiment = analysis.sentiment.sentiment.value
+        results.append({
+            "ticket_id": ticket_id,
+            "subject": subject,
+            "sentiment": sentiment,
+            "confidence": analysis.sentiment.confidence,
+            "is_negative": sentiment in ["negative", "very_negative"],
+            "reasoning": analysis.sentiment.reasoning,
+            "topics": [t.topic_name for t in analysis.topics]
+        })
+
+    return results
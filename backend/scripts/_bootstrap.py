@@ -0,0 +1,44 @@
+"""Put the backend directory on sys.path exactly once.
+
+Every script used to recompute `Path(__file__).parent.parent` and
+unconditionally `sys.path.insert(0, ...)`, which accumulates duplicate
+entries that every subsequent import walks. Importing this module instead
+does the insert a single time, idempotently.
+
+The common imports the test scripts need can also be pulled from here
+(`from _bootstrap import settings, OpenRouterAnalyzer`); they resolve
+lazily via module __getattr__ so scripts that only need the path insert
+don't pay for pydantic settings construction or the analyzer stack.
+"""
+
+import os
+import sys
+
+_backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if _backend_dir not in sys.path:
+    sys.path.insert(0, _backend_dir)
+
+# The scripts are pure IO-bound coroutine drivers, so the libuv-backed
+# loop's cheaper task scheduling and socket dispatch benefit all of them
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:  # uvloop has no Windows wheels
+    pass
+
+
+def short(s, n=60):
+    """Truncate a display string to n columns with an ellipsis."""
+    import textwrap
+    return textwrap.shorten(s, n, placeholder="…")
+
+
+def __getattr__(name):
+    if name == "settings":
+        from src.core.config import settings
+        return settings
+    if name == "OpenRouterAnalyzer":
+        from src.services.openrouter import OpenRouterAnalyzer
+        return OpenRouterAnalyzer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,32 @@
+"""Shared database engine/session factory for the utility scripts.
+
+The scripts used to call `create_engine` + `sessionmaker` inline on every
+run; constructing an engine is expensive (dialect compilation, driver
+probing), so build it once here and hand out sessions from a single
+sessionmaker.
+"""
+
+from functools import lru_cache
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.core.config import settings
+
+
+@lru_cache
+def get_engine():
+    """Return the process-wide engine, creating it on first use."""
+    return create_engine(settings.DATABASE_URL, pool_pre_ping=True, pool_size=5)
+
+
+@lru_cache
+def _session_factory():
+    # expire_on_commit=False keeps loaded attributes (e.g. integration
+    # credentials) usable after commit without a re-SELECT
+    return sessionmaker(bind=get_engine(), expire_on_commit=False)
+
+
+def Session():
+    """Create a new session bound to the shared engine."""
+    return _session_factory()()
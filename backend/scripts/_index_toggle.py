@@ -0,0 +1,53 @@
+"""Context manager for dropping/recreating indexes around bulk loads.
+
+Every secondary index on a table adds write amplification to each INSERT
+during a bulk load. For large backfills it is cheaper to drop the
+non-essential indexes, load the data, and rebuild the indexes once at the
+end (CONCURRENTLY, so the table stays available).
+
+Usage:
+
+    engine = get_engine()
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        with without_indexes(conn, "tickets"):
+            bulk_load(...)
+"""
+
+from contextlib import contextmanager
+
+from sqlalchemy import text
+
+
+@contextmanager
+def without_indexes(conn, table, keep=("pkey",)):
+    """Drop a table's secondary indexes for the block, then rebuild them.
+
+    Captures each index's definition from `pg_indexes`, drops everything
+    whose name doesn't contain one of the `keep` markers (primary keys by
+    default), and recreates them CONCURRENTLY on exit. The connection must
+    be in autocommit mode since CONCURRENTLY cannot run in a transaction.
+    """
+    rows = conn.execute(
+        text(
+            "SELECT indexname, indexdef FROM pg_indexes "
+            "WHERE tablename = :table"
+        ),
+        {"table": table},
+    ).all()
+
+    dropped = []
+    for indexname, indexdef in rows:
+        if any(marker in indexname for marker in keep):
+            continue
+        conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {indexname}"))
+        dropped.append(indexdef)
+
+    try:
+        yield
+    finally:
+        # Rebuild whatever we dropped, even if the load failed partway
+        for indexdef in dropped:
+            conn.execute(text(
+                indexdef.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1)
+                        .replace("CREATE UNIQUE INDEX", "CREATE UNIQUE INDEX CONCURRENTLY", 1)
+            ))
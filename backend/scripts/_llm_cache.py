@@ -0,0 +1,104 @@
+"""Disk cache for LLM ticket analyses, keyed by model + content hash.
+
+Re-running the fetch scripts against the same HubSpot tickets used to pay
+the full OpenRouter round-trip every time. Caching the typed analysis
+result on disk lets development re-runs complete in milliseconds. Entries
+expire after a week so the cache tracks model/prompt changes eventually;
+changing OPENROUTER_MODEL invalidates immediately since it's in the key.
+"""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+
+import orjson
+
+from src.core.config import settings
+from src.schemas.ai import TicketAnalysisResult
+
+CACHE_DIR = Path(__file__).parent.parent / ".llm_cache"
+CACHE_TTL_SECONDS = 7 * 86400
+
+
+def _cache_path(full_text: str) -> Path:
+    key = hashlib.blake2b(
+        f"{settings.OPENROUTER_MODEL}|{full_text}".encode()
+    ).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+
+def get_cached_analysis(full_text: str) -> TicketAnalysisResult | None:
+    """Return the cached analysis for this content, or None on miss."""
+    path = _cache_path(full_text)
+    try:
+        if time.time() - path.stat().st_mtime > CACHE_TTL_SECONDS:
+            return None
+        return TicketAnalysisResult.model_validate_json(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def cache_analysis(full_text: str, analysis: TicketAnalysisResult) -> None:
+    """Store an analysis result for future runs."""
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        _cache_path(full_text).write_text(analysis.model_dump_json())
+    except OSError:
+        # Cache writes are best-effort; analysis already succeeded
+        pass
+
+
+def get_cached_json(key_text: str):
+    """Return a cached raw-JSON payload for this key, or None on miss."""
+    path = _cache_path(key_text)
+    try:
+        if time.time() - path.stat().st_mtime > CACHE_TTL_SECONDS:
+            return None
+        return orjson.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def cache_json(key_text: str, payload) -> None:
+    """Store an arbitrary JSON-serializable payload for future runs."""
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        _cache_path(key_text).write_bytes(orjson.dumps(payload))
+    except OSError:
+        pass
+
+
+async def cached_analyze(
+    analyzer,
+    ticket_content: str,
+    available_topics: list[str] | None = None,
+    training_rules: list[str] | None = None,
+) -> TicketAnalysisResult:
+    """Analyze a ticket through the disk cache, gated by CHURN_TEST_CACHE=1.
+
+    The test scripts exist to exercise the live OpenRouter path, so caching
+    is opt-in there: set CHURN_TEST_CACHE=1 when iterating on script output
+    rather than on the analysis itself, and repeat runs skip the ~1-2s LLM
+    round-trip per ticket.
+    """
+    if os.environ.get("CHURN_TEST_CACHE") != "1":
+        return await analyzer.analyze_ticket(
+            ticket_content=ticket_content,
+            available_topics=available_topics,
+            training_rules=training_rules,
+        )
+
+    # Topics and rules shape the classification, so they belong in the key
+    key_text = f"{ticket_content}|topics={available_topics}|rules={training_rules}"
+    cached = get_cached_analysis(key_text)
+    if cached is not None:
+        return cached
+
+    analysis = await analyzer.analyze_ticket(
+        ticket_content=ticket_content,
+        available_topics=available_topics,
+        training_rules=training_rules,
+    )
+    cache_analysis(key_text, analysis)
+    return analysis
@@ -0,0 +1,69 @@
+"""Shared httpx client for the OpenRouter debug scripts.
+
+test_gemini_json.py and test_openrouter_raw.py used to build a fresh
+`httpx.AsyncClient` per request, paying a TCP+TLS handshake to
+openrouter.ai each time. One module-level pooled client amortizes the
+handshake to the first call; HTTP/2 lets repeat requests multiplex over a
+single connection.
+"""
+
+import asyncio
+
+import httpx
+
+from src.core.config import settings
+from scripts._llm_cache import CACHE_DIR
+
+# Remember which backend provider OpenRouter routed us to, so repeat runs
+# can ask for the same (already warm) provider first instead of paying a
+# fresh cold start each invocation
+_PROVIDER_CACHE = CACHE_DIR / "provider"
+
+client = httpx.AsyncClient(
+    base_url="https://openrouter.ai/api/v1",
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    # Per-phase budgets: a slow LLM generation (read) should not share its
+    # budget with a hung DNS lookup (connect), and a stalled connect should
+    # fail fast instead of burning the whole read budget.
+    timeout=httpx.Timeout(60.0, connect=5.0, write=10.0, pool=5.0),
+    headers={
+        "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
+        "Content-Type": "application/json",
+    },
+)
+
+
+def provider_preferences():
+    """Routing preferences biased toward the last provider that served us."""
+    order = ["Google AI Studio"]
+    try:
+        cached = _PROVIDER_CACHE.read_text().strip()
+        if cached and cached not in order:
+            order.insert(0, cached)
+    except OSError:
+        pass
+    return {"order": order, "allow_fallbacks": True}
+
+
+def remember_provider(response):
+    """Persist the provider OpenRouter chose, best-effort."""
+    provider = response.headers.get("x-or-provider")
+    if not provider:
+        return
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        _PROVIDER_CACHE.write_text(provider)
+    except OSError:
+        pass
+
+
+def run(coro):
+    """Run a script's main coroutine, closing the shared client at exit."""
+    async def _main():
+        try:
+            return await coro
+        finally:
+            await client.aclose()
+
+    return asyncio.run(_main())
@@ -10,27 +10,46 @@ This script will:
 """
 
 import asyncio
+import re
 import sys
-from pathlib import Path
+from urllib.parse import urlencode
 
-# Add backend to Python path
-backend_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(backend_dir))
+# Add backend to Python path (idempotent, shared across scripts)
+import _bootstrap  # noqa: F401
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import exists, select
+from sqlalchemy.orm import load_only
 from src.core.config import settings
 from src.models.integration import Integration, IntegrationType, IntegrationStatus
 from src.integrations.hubspot import HubSpotClient
 from src.services.openrouter import OpenRouterAnalyzer
+from scripts._analysis_utils import analyze_tickets_concurrently, fetch_tickets_paginated
+from scripts._db import Session
 import webbrowser
 
+_AUTH_ERR = re.compile(r"\b(?:401|403)\b")
+_OAUTH_SCOPES = "crm.objects.contacts.read crm.objects.companies.read tickets"
+
+# Built once; urlencode also properly escapes the space-delimited scopes,
+# which the old raw f-string interpolation didn't
+AUTH_URL = "https://app.hubspot.com/oauth/authorize?" + urlencode({
+    "client_id": settings.HUBSPOT_CLIENT_ID,
+    "redirect_uri": settings.HUBSPOT_REDIRECT_URI,
+    "scope": _OAUTH_SCOPES,
+})
+
 
 async def get_or_create_integration(db, oauth_code=None):
     """Get existing HubSpot integration or guide user through OAuth."""
-    integration = db.query(Integration).filter(
-        Integration.type == IntegrationType.HUBSPOT
-    ).first()
+    # Cheap EXISTS probe first; only load the row (and its credentials
+    # blob) when there is actually something to load
+    integration = None
+    if db.scalar(select(exists().where(Integration.type == IntegrationType.HUBSPOT))):
+        integration = db.query(Integration).options(
+            load_only(Integration.id, Integration.status, Integration.credentials)
+        ).filter(
+            Integration.type == IntegrationType.HUBSPOT
+        ).first()
 
     if integration and integration.credentials and "access_token" in integration.credentials:
         print(f"✓ Found existing HubSpot integration (ID: {integration.id})")
@@ -42,14 +61,6 @@ async def get_or_create_integration(db, oauth_code=None):
     print("="*70)
     print("\nNo HubSpot integration found. You need to complete OAuth flow.")
 
-    # Generate OAuth URL
-    auth_url = (
-        f"https://app.hubspot.com/oauth/authorize"
-        f"?client_id={settings.HUBSPOT_CLIENT_ID}"
-        f"&redirect_uri={settings.HUBSPOT_REDIRECT_URI}"
-        f"&scope=crm.objects.contacts.read crm.objects.companies.read tickets"
-    )
-
     if not oauth_code:
         print("\nSteps:")
         print("1. Visit the authorization URL below")
@@ -58,11 +69,11 @@ async def get_or_create_integration(db, oauth_code=None):
         print("4. Run this script again with: python scripts/fetch_and_analyze_tickets.py YOUR_CODE")
 
         print(f"\n📋 Authorization URL:")
-        print(f"   {auth_url}")
+        print(f"   {AUTH_URL}")
         print(f"\n🌐 Opening in browser...")
 
         try:
-            webbrowser.open(auth_url)
+            webbrowser.open(AUTH_URL)
         except Exception as e:
             print(f"   Could not open browser: {e}")
             print(f"   Please open the URL manually")
@@ -94,8 +105,8 @@ async def get_or_create_integration(db, oauth_code=None):
         # In a real app, this would be associated with the logged-in user's tenant
         from src.models.tenant import Tenant
 
-        # Check if we have any tenant
-        tenant = db.query(Tenant).first()
+        # Check if we have any tenant (only the id is needed)
+        tenant = db.query(Tenant).options(load_only(Tenant.id)).first()
         if not tenant:
             print("\n⚠️  No tenant found in database. Creating a test tenant...")
             from src.models.tenant import PlanTier
@@ -138,8 +149,7 @@ async def fetch_tickets(integration, limit=20):
     client = HubSpotClient(access_token=access_token)
 
     try:
-        response = await client.get_tickets(limit=limit)
-        tickets = response.get("results", [])
+        tickets = await fetch_tickets_paginated(client, limit, properties=["subject", "content"])
 
         print(f"✓ Fetched {len(tickets)} tickets")
 
@@ -149,7 +159,7 @@ async def fetch_tickets(integration, limit=20):
         print(f"❌ Error fetching tickets: {e}")
 
         # Check if it's an auth error
-        if "401" in str(e) or "403" in str(e):
+        if _AUTH_ERR.search(str(e)):
             print("\n⚠️  Authentication failed. Token may have expired.")
             print("   Trying to refresh token...")
 
@@ -166,10 +176,10 @@ async def fetch_tickets(integration, limit=20):
 
                     print("✓ Token refreshed successfully. Retrying...")
 
-                    # Retry with new token
-                    client = HubSpotClient(access_token=new_token_data["access_token"])
-                    response = await client.get_tickets(limit=limit)
-                    tickets = response.get("results", [])
+                    # Retry with the same client, just swapping the token so
+                    # pooled connections survive the refresh
+                    client.set_access_token(new_token_data["access_token"])
+                    tickets = await fetch_tickets_paginated(client, limit, properties=["subject", "content"])
 
                     print(f"✓ Fetched {len(tickets)} tickets")
                     return tickets
@@ -188,59 +198,31 @@ async def analyze_tickets(tickets):
     """Analyze sentiment for each ticket using Gemini Flash."""
     print(f"\n🤖 Analyzing sentiment with AI...")
     print(f"   Model: {settings.OPENROUTER_MODEL}")
+    print(f"   Analyzing {len(tickets)} tickets concurrently...")
 
     # Initialize analyzer (uses model from settings)
     analyzer = OpenRouterAnalyzer()
 
-    results = []
-
-    for i, ticket in enumerate(tickets, 1):
-        ticket_id = ticket.get("id")
-        properties = ticket.get("properties", {})
-        subject = properties.get("subject", "No subject")
-        content = properties.get("content", "")
-
-        # Combine subject and content for analysis
-        full_text = f"{subject}\n\n{content}" if content else subject
+    results = await analyze_tickets_concurrently(analyzer, tickets)
 
-        print(f"\n[{i}/{len(tickets)}] Analyzing ticket {ticket_id}...")
-        print(f"   Subject: {subject[:60]}{'...' if len(subject) > 60 else ''}")
+    # Buffer the per-ticket report and write it in one go rather than
+    # paying a stdout write per line
+    lines = []
+    n = len(results)
+    for i, r in enumerate(results, 1):
+        subject = r["subject"]
+        lines.append(f"\n[{i}/{n}] Ticket {r['ticket_id']}")
+        lines.append(f"   Subject: {subject[:60]}{'...' if len(subject) > 60 else ''}")
 
-        try:
-            # Analyze (no topics, just sentiment)
-            analysis = await analyzer.analyze_ticket(
-                ticket_content=full_text,
-                available_topics=None
-            )
-
-            sentiment = analysis.sentiment.sentiment.value
-            confidence = analysis.sentiment.confidence
-            is_negative = sentiment in ["negative", "very_negative"]
+        if r["sentiment"] == "error":
+            lines.append(f"   ❌ Error analyzing ticket: {r['error']}")
+            continue
 
-            print(f"   Sentiment: {sentiment.upper()} (confidence: {confidence:.2f})")
-            if is_negative:
-                print(f"   ⚠️  NEGATIVE - potential churn risk")
+        lines.append(f"   Sentiment: {r['sentiment'].upper()} (confidence: {r['confidence']:.2f})")
+        if r["is_negative"]:
+            lines.append(f"   ⚠️  NEGATIVE - potential churn risk")
 
-            results.append({
-                "ticket_id": ticket_id,
-                "subject": subject,
-                "sentiment": sentiment,
-                "confidence": confidence,
-                "is_negative": is_negative,
-                "reasoning": analysis.sentiment.reasoning,
-                "topics": [t.topic_name for t in analysis.topics]
-            })
-
-        except Exception as e:
-            print(f"   ❌ Error analyzing ticket: {e}")
-            results.append({
-                "ticket_id": ticket_id,
-                "subject": subject,
-                "sentiment": "error",
-                "confidence": 0.0,
-                "is_negative": False,
-                "error": str(e)
-            })
+    print("\n".join(lines))
 
     return results
 
@@ -252,11 +234,15 @@ def display_summary(results):
     print("="*70)
 
     total = len(results)
-    negative_count = sum(1 for r in results if r.get("is_negative", False))
-    error_count = sum(1 for r in results if r.get("sentiment") == "error")
+    negative_count = 0
+    error_count = 0
+    for r in results:
+        negative_count += r.get("is_negative", False)
+        error_count += r.get("sentiment") == "error"
+    negative_pct = (negative_count * 100.0 / total) if total else 0.0
 
     print(f"\nTotal tickets analyzed: {total}")
-    print(f"Negative/Very Negative: {negative_count} ({negative_count/total*100:.1f}%)")
+    print(f"Negative/Very Negative: {negative_count} ({negative_pct:.1f}%)")
     print(f"Errors: {error_count}")
 
     if negative_count > 0:
@@ -289,8 +275,6 @@ async def main():
         print(f"\n✓ Using OAuth code from command line")
 
     # Connect to database
-    engine = create_engine(settings.DATABASE_URL)
-    Session = sessionmaker(bind=engine)
     db = Session()
 
     try:
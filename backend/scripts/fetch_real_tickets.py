@@ -2,18 +2,18 @@
 """Fetch and analyze real HubSpot tickets from the connected integration."""
 
 import asyncio
-import sys
-from pathlib import Path
 
-backend_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(backend_dir))
+# Add backend to Python path (idempotent, shared across scripts)
+import _bootstrap  # noqa: F401
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import exists, select
+from sqlalchemy.orm import load_only
 from src.core.config import settings
 from src.models.integration import Integration, IntegrationType
 from src.integrations.hubspot import HubSpotClient
 from src.services.openrouter import OpenRouterAnalyzer
+from scripts._analysis_utils import analyze_tickets_concurrently, fetch_tickets_paginated
+from scripts._db import Session
 
 
 async def main():
@@ -22,20 +22,21 @@ async def main():
     print("="*70)
 
     # Connect to database
-    engine = create_engine(settings.DATABASE_URL)
-    Session = sessionmaker(bind=engine)
     db = Session()
 
     try:
+        # Cheap EXISTS probe before pulling the row and its credentials blob
+        if not db.scalar(select(exists().where(Integration.type == IntegrationType.HUBSPOT))):
+            print("❌ No HubSpot integration found. Run OAuth flow first.")
+            return
+
         # Get the HubSpot integration
-        integration = db.query(Integration).filter(
+        integration = db.query(Integration).options(
+            load_only(Integration.id, Integration.status, Integration.credentials)
+        ).filter(
             Integration.type == IntegrationType.HUBSPOT
         ).first()
 
-        if not integration:
-            print("❌ No HubSpot integration found. Run OAuth flow first.")
-            return
-
         print(f"\n✓ Found HubSpot integration (ID: {integration.id})")
         print(f"  Status: {integration.status}")
         
@@ -45,8 +46,7 @@ async def main():
         print(f"\n📥 Fetching tickets from FlxPoint HubSpot...")
         client = HubSpotClient(access_token=access_token)
         
-        response = await client.get_tickets(limit=20)
-        tickets = response.get("results", [])
+        tickets = await fetch_tickets_paginated(client, 20, properties=["subject", "content"])
         
         print(f"✓ Fetched {len(tickets)} tickets")
         
@@ -57,43 +57,27 @@ async def main():
         # Analyze with AI
         print(f"\n🤖 Analyzing sentiment with {settings.OPENROUTER_MODEL}...")
         analyzer = OpenRouterAnalyzer()
-        
-        results = []
-        
-        for i, ticket in enumerate(tickets, 1):
-            ticket_id = ticket.get("id")
-            properties = ticket.get("properties", {})
-            subject = properties.get("subject", "No subject")
-            content = properties.get("content", "")
-            
-            full_text = f"{subject}\n\n{content}" if content else subject
-            
-            print(f"\n[{i}/{len(tickets)}] {subject[:50]}...")
-
-            try:
-                analysis = await analyzer.analyze_ticket(full_text, available_topics=None)
-                
-                sentiment = analysis.sentiment.sentiment.value
-                confidence = analysis.sentiment.confidence
-                is_negative = sentiment in ["negative", "very_negative"]
-                
-                print(f"   → {sentiment.upper()} ({confidence:.0%} confidence)")
-                
-                if is_negative:
-                    print(f"   ⚠️  CHURN RISK")
-                
-                results.append({
-                    "ticket_id": ticket_id,
-                    "subject": subject,
-                    "sentiment": sentiment,
-                    "confidence": confidence,
-                    "is_negative": is_negative,
-                    "reasoning": analysis.sentiment.reasoning
-                })
-                
-            except Exception as e:
-                print(f"   ❌ Error: {e}")
-        
+
+        results = await analyze_tickets_concurrently(analyzer, tickets)
+
+        # Buffer the per-ticket report and write it in one go rather than
+        # paying a stdout write per line
+        lines = []
+        n = len(results)
+        for i, r in enumerate(results, 1):
+            lines.append(f"\n[{i}/{n}] {r['subject'][:50]}...")
+
+            if r["sentiment"] == "error":
+                lines.append(f"   ❌ Error: {r['error']}")
+                continue
+
+            lines.append(f"   → {r['sentiment'].upper()} ({r['confidence']:.0%} confidence)")
+
+            if r["is_negative"]:
+                lines.append(f"   ⚠️  CHURN RISK")
+
+        print("\n".join(lines))
+
         # Summary
         print("\n" + "="*70)
         print("  Summary")
@@ -101,9 +85,10 @@ async def main():
         
         total = len(results)
         negative_count = sum(1 for r in results if r["is_negative"])
-        
+        negative_pct = (negative_count * 100.0 / total) if total else 0.0
+
         print(f"\nTotal tickets analyzed: {total}")
-        print(f"Churn risk tickets: {negative_count} ({negative_count/total*100:.1f}%)")
+        print(f"Churn risk tickets: {negative_count} ({negative_pct:.1f}%)")
         
         if negative_count > 0:
             print(f"\n⚠️  Tickets flagged as churn risk:")
@@ -16,26 +16,25 @@ Setup:
 
 import asyncio
 import sys
-from pathlib import Path
 
-# Add backend to Python path
-backend_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(backend_dir))
+# Add backend to Python path (idempotent, shared across scripts)
+import _bootstrap  # noqa: F401
 
-from src.integrations.hubspot import HubSpotClient
-from src.services.openrouter import OpenRouterAnalyzer
-from src.core.config import settings
+# Heavy imports (httpx, pydantic, sqlalchemy via src.*) are deferred into
+# the functions below so the no-token usage/error path stays instant
 
 
 async def fetch_tickets(access_token, limit=20):
     """Fetch tickets from HubSpot."""
+    from src.integrations.hubspot import HubSpotClient
+    from scripts._analysis_utils import fetch_tickets_paginated
+
     print(f"\n📥 Fetching {limit} tickets from HubSpot...")
 
     client = HubSpotClient(access_token=access_token)
 
     try:
-        response = await client.get_tickets(limit=limit)
-        tickets = response.get("results", [])
+        tickets = await fetch_tickets_paginated(client, limit, properties=["subject", "content"])
 
         print(f"✓ Fetched {len(tickets)} tickets")
 
@@ -57,61 +56,37 @@ async def fetch_tickets(access_token, limit=20):
 
 async def analyze_tickets(tickets):
     """Analyze sentiment for each ticket using AI."""
+    from src.core.config import settings
+    from src.services.openrouter import OpenRouterAnalyzer
+    from scripts._analysis_utils import analyze_tickets_concurrently
+
     print(f"\n🤖 Analyzing sentiment with AI...")
     print(f"   Model: {settings.OPENROUTER_MODEL}")
+    print(f"   Analyzing {len(tickets)} tickets concurrently...")
 
     # Initialize analyzer (uses model from settings)
     analyzer = OpenRouterAnalyzer()
 
-    results = []
-
-    for i, ticket in enumerate(tickets, 1):
-        ticket_id = ticket.get("id")
-        properties = ticket.get("properties", {})
-        subject = properties.get("subject", "No subject")
-        content = properties.get("content", "")
-
-        # Combine subject and content for analysis
-        full_text = f"{subject}\n\n{content}" if content else subject
-
-        print(f"\n[{i}/{len(tickets)}] Analyzing ticket {ticket_id}...")
-        print(f"   Subject: {subject[:60]}{'...' if len(subject) > 60 else ''}")
-
-        try:
-            # Analyze (no topics, just sentiment)
-            analysis = await analyzer.analyze_ticket(
-                ticket_content=full_text,
-                available_topics=None
-            )
-
-            sentiment = analysis.sentiment.sentiment.value
-            confidence = analysis.sentiment.confidence
-            is_negative = sentiment in ["negative", "very_negative"]
-
-            print(f"   Sentiment: {sentiment.upper()} (confidence: {confidence:.2f})")
-            if is_negative:
-                print(f"   ⚠️  NEGATIVE - potential churn risk")
-
-            results.append({
-                "ticket_id": ticket_id,
-                "subject": subject,
-                "sentiment": sentiment,
-                "confidence": confidence,
-                "is_negative": is_negative,
-                "reasoning": analysis.sentiment.reasoning,
-                "topics": [t.topic_name for t in analysis.topics]
-            })
-
-        except Exception as e:
-            print(f"   ❌ Error analyzing ticket: {e}")
-            results.append({
-                "ticket_id": ticket_id,
-                "subject": subject,
-                "sentiment": "error",
-                "confidence": 0.0,
-                "is_negative": False,
-                "error": str(e)
-            })
+    results = await analyze_tickets_concurrently(analyzer, tickets)
+
+    # Buffer the per-ticket report and write it in one go rather than
+    # paying a stdout write per line
+    lines = []
+    n = len(results)
+    for i, r in enumerate(results, 1):
+        subject = r["subject"]
+        lines.append(f"\n[{i}/{n}] Ticket {r['ticket_id']}")
+        lines.append(f"   Subject: {subject[:60]}{'...' if len(subject) > 60 else ''}")
+
+        if r["sentiment"] == "error":
+            lines.append(f"   ❌ Error analyzing ticket: {r['error']}")
+            continue
+
+        lines.append(f"   Sentiment: {r['sentiment'].upper()} (confidence: {r['confidence']:.2f})")
+        if r["is_negative"]:
+            lines.append(f"   ⚠️  NEGATIVE - potential churn risk")
+
+    print("\n".join(lines))
 
     return results
 
@@ -123,11 +98,15 @@ def display_summary(results):
     print("="*70)
 
     total = len(results)
-    negative_count = sum(1 for r in results if r.get("is_negative", False))
-    error_count = sum(1 for r in results if r.get("sentiment") == "error")
+    negative_count = 0
+    error_count = 0
+    for r in results:
+        negative_count += r.get("is_negative", False)
+        error_count += r.get("sentiment") == "error"
+    negative_pct = (negative_count * 100.0 / total) if total else 0.0
 
     print(f"\nTotal tickets analyzed: {total}")
-    print(f"Negative/Very Negative: {negative_count} ({negative_count/total*100:.1f}%)")
+    print(f"Negative/Very Negative: {negative_count} ({negative_pct:.1f}%)")
     print(f"Errors: {error_count}")
 
     if negative_count > 0:
@@ -1,42 +1,48 @@
 #!/usr/bin/env python3
 """Complete reset: Clear database AND Firebase users."""
 
-import sys
-from pathlib import Path
-
-backend_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(backend_dir))
-
-import os
-import firebase_admin
-from firebase_admin import auth, credentials
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from src.core.config import settings
-from src.models.tenant import Tenant
-from src.models.user import User
-from src.models.integration import Integration
-from src.models.ticket import Ticket
+# Add backend to Python path (idempotent, shared across scripts)
+import _bootstrap  # noqa: F401
+
+# firebase_admin and SQLAlchemy are slow imports; keep them inside the
+# functions so the script starts (and can fail fast) instantly
 
 def clear_database():
     """Clear all data from database."""
+    from sqlalchemy import text
+    from src.core.config import settings
+    from src.models.tenant import Tenant
+    from src.models.user import User
+    from src.models.integration import Integration
+    from src.models.ticket import Ticket
+    from scripts._db import Session
+
     print("\n" + "=" * 70)
     print("  Clearing Database")
     print("=" * 70)
 
-    engine = create_engine(settings.DATABASE_URL)
-    Session = sessionmaker(bind=engine)
     db = Session()
 
     try:
         tenant_count = db.query(Tenant).count()
         if tenant_count == 0:
             print("\n✅ Database already empty!")
-        else:
+        elif settings.DATABASE_URL.startswith("sqlite"):
+            # SQLite has no TRUNCATE; fall back to the ORM cascade path
             print(f"\n🗑️  Deleting {tenant_count} tenants...")
             deleted = db.query(Tenant).delete()
             db.commit()
             print(f"✅ Deleted {deleted} tenants and all related data")
+        else:
+            # TRUNCATE ... CASCADE clears everything in O(1) catalog ops
+            # instead of per-row DELETEs through the ORM cascade
+            print(f"\n🗑️  Truncating all tables ({tenant_count} tenants)...")
+            db.execute(text(
+                "TRUNCATE TABLE tickets, integrations, users, tenants "
+                "RESTART IDENTITY CASCADE"
+            ))
+            db.commit()
+            print(f"✅ Truncated all tenant data")
 
         # Verify
         print("\n📊 Final database state:")
@@ -54,6 +60,12 @@ def clear_database():
 
 def clear_firebase():
     """Clear all Firebase users."""
+    import os
+
+    import firebase_admin
+    from firebase_admin import auth, credentials
+    from src.core.config import settings
+
     print("\n" + "=" * 70)
     print("  Clearing Firebase Users")
     print("=" * 70)
@@ -67,36 +79,36 @@ def clear_firebase():
         firebase_admin.initialize_app(cred)
 
     try:
-        # List all users
-        page = auth.list_users()
-        users = list(page.users)
+        # Stream users lazily and delete in batches (delete_users takes up
+        # to 1000 UIDs per request) so deletion starts before pagination
+        # finishes and we never hold every UserRecord in memory at once
+        print(f"\n🗑️  Deleting Firebase users...")
 
-        # Get all users by iterating through pages
-        while page.next_page_token:
-            page = auth.list_users(page_token=page.next_page_token)
-            users.extend(page.users)
+        total_count = 0
+        deleted_count = 0
+        batch = []
 
-        if not users:
-            print("\n✅ No Firebase users to delete!")
-            return
+        def flush(batch):
+            result = auth.delete_users([user.uid for user in batch])
+            for error in result.errors:
+                print(f"  ✗ Failed to delete {batch[error.index].email}: {error.reason}")
+            return result.success_count
 
-        print(f"\n📊 Found {len(users)} Firebase users:")
-        for user in users:
-            print(f"  - {user.email} (uid: {user.uid})")
+        for user in auth.list_users().iterate_all():
+            total_count += 1
+            batch.append(user)
+            if len(batch) == 1000:
+                deleted_count += flush(batch)
+                batch = []
 
-        # Delete all users
-        print(f"\n🗑️  Deleting all {len(users)} Firebase users...")
+        if batch:
+            deleted_count += flush(batch)
 
-        deleted_count = 0
-        for user in users:
-            try:
-                auth.delete_user(user.uid)
-                deleted_count += 1
-                print(f"  ✓ Deleted {user.email}")
-            except Exception as e:
-                print(f"  ✗ Failed to delete {user.email}: {e}")
-
-        print(f"\n✅ Deleted {deleted_count}/{len(users)} Firebase users")
+        if total_count == 0:
+            print("\n✅ No Firebase users to delete!")
+            return
+
+        print(f"\n✅ Deleted {deleted_count}/{total_count} Firebase users")
 
     except Exception as e:
         print(f"\n❌ Firebase Error: {e}")
@@ -4,9 +4,14 @@ Smoke test script to verify HubSpot and OpenRouter integrations.
 Run with: poetry run python scripts/smoke_test.py
 """
 import asyncio
+
+# Add backend to Python path (idempotent, shared across scripts)
+import _bootstrap  # noqa: F401
+from _bootstrap import short
+
 from src.core.config import settings
-from src.integrations.hubspot import HubSpotClient
 from src.services.openrouter import OpenRouterAnalyzer
+from scripts._llm_cache import cached_analyze
 
 
 async def test_hubspot():
@@ -59,14 +64,15 @@ This is extremely frustrating as we have orders backing up. Please help ASAP!
         analyzer = OpenRouterAnalyzer()
 
         print(f"\nAnalyzing ticket content...")
-        print(f"Content preview: {ticket_content[:100]}...")
+        print(f"Content preview: {short(ticket_content, 100)}")
 
         # Test sentiment analysis only (no topics yet)
         print("\nRunning sentiment analysis...")
-        result = await analyzer.analyze_ticket(
+        result = await cached_analyze(
+            analyzer,
             ticket_content=ticket_content,
-            available_topics=[],  # No topics configured yet
-            training_rules=[]
+            available_topics=None,  # No topics configured yet
+            training_rules=None
         )
 
         print(f"✅ Analysis complete!")
@@ -97,27 +103,44 @@ async def test_database():
     print(f"Database URL: {settings.DATABASE_URL}")
 
     try:
-        from src.core.database import engine
         from sqlalchemy import text
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        # Async engine keeps the event loop responsive while the queries
+        # run, instead of blocking it behind a sync connect
+        engine = create_async_engine(
+            settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://"),
+            pool_size=5,
+            max_overflow=10,
+            pool_pre_ping=True,
+        )
 
-        # Test connection
-        with engine.connect() as conn:
-            result = conn.execute(text("SELECT version()"))
-            version = result.scalar()
-            print(f"✅ Connected to PostgreSQL")
-            print(f"  Version: {version.split(',')[0]}")
-
-            # Check tables exist
-            result = conn.execute(text("""
-                SELECT table_name
-                FROM information_schema.tables
-                WHERE table_schema = 'public'
-                ORDER BY table_name
-            """))
-            tables = [row[0] for row in result]
-            print(f"  Tables: {len(tables)} found")
-            for table in tables:
-                print(f"    - {table}")
+        try:
+            async with engine.connect() as conn:
+                result = await conn.execute(text("SELECT version()"))
+                version = result.scalar()
+                print(f"✅ Connected to PostgreSQL")
+                print(f"  Version: {version.split(',')[0]}")
+
+                # Count server-side for the banner, then stream the names
+                # instead of materializing every row into a Python list
+                table_count = (await conn.execute(text("""
+                    SELECT count(*)
+                    FROM information_schema.tables
+                    WHERE table_schema = 'public'
+                """))).scalar()
+                print(f"  Tables: {table_count} found")
+
+                result = await conn.stream(text("""
+                    SELECT table_name
+                    FROM information_schema.tables
+                    WHERE table_schema = 'public'
+                    ORDER BY table_name
+                """))
+                async for row in result.yield_per(100):
+                    print(f"    - {row[0]}")
+        finally:
+            await engine.dispose()
 
         return True
 
@@ -132,15 +155,21 @@ async def main():
     print("🚀 SMOKE TEST - Churn Risk App")
     print("=" * 60)
 
-    # Test database
-    db_ok = await test_database()
-
-    # Test HubSpot
-    sample_ticket = await test_hubspot()
+    # The three probes are independent IO-bound checks, so run them
+    # concurrently: wall time is max(latencies) instead of the sum.
+    # test_hubspot never yields a ticket (OAuth needs a user), so
+    # test_openrouter no longer waits on it.
+    db_ok, sample_ticket, openrouter_ok = await asyncio.gather(
+        test_database(),
+        test_hubspot(),
+        test_openrouter(None),
+        return_exceptions=True,
+    )
+    db_ok = db_ok is True
+    if isinstance(sample_ticket, Exception):
+        sample_ticket = None
     hubspot_ok = sample_ticket is not None
-
-    # Test OpenRouter (with real ticket if available)
-    openrouter_ok = await test_openrouter(sample_ticket)
+    openrouter_ok = openrouter_ok is True
 
     # Summary
     print("\n" + "=" * 60)
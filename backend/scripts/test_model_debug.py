@@ -2,14 +2,8 @@
 """Debug script to test the model configuration."""
 
 import asyncio
-import sys
-from pathlib import Path
 
-backend_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(backend_dir))
-
-from src.services.openrouter import OpenRouterAnalyzer
-from src.core.config import settings
+from _bootstrap import OpenRouterAnalyzer, settings
 
 async def main():
     print(f"Testing OpenRouter configuration:")
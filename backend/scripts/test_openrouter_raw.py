@@ -1,49 +1,61 @@
 #!/usr/bin/env python3
 """Test raw OpenRouter API response."""
 
-import asyncio
-import httpx
-import sys
-from pathlib import Path
+# Add backend to Python path (idempotent, shared across scripts)
+import _bootstrap  # noqa: F401
 
-backend_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(backend_dir))
+import ijson
 
 from src.core.config import settings
+from scripts._openrouter_http import client, provider_preferences, remember_provider, run
 
 async def main():
     print(f"Testing OpenRouter API directly...")
     print(f"Model: {settings.OPENROUTER_MODEL}\n")
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            "https://openrouter.ai/api/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": settings.OPENROUTER_MODEL,
-                "messages": [
-                    {"role": "system", "content": "You are a helpful assistant."},
-                    {"role": "user", "content": "Say hello"}
-                ],
-                "response_format": {"type": "json_object"}
-            },
-            timeout=30.0
-        )
-        
+
+    # Stream the response and parse the message content incrementally as
+    # chunks arrive; the body is never buffered whole, and we stop reading
+    # as soon as the first message content is complete
+    async with client.stream(
+        "POST",
+        "/chat/completions",
+        json={
+            "model": settings.OPENROUTER_MODEL,
+            "messages": [
+                {"role": "system", "content": "You are a helpful assistant."},
+                {"role": "user", "content": "Say hello"}
+            ],
+            "response_format": {"type": "json_object"},
+            "provider": provider_preferences()
+        }
+    ) as response:
+        remember_provider(response)
         print(f"Status: {response.status_code}")
         print(f"Headers: {dict(response.headers)}")
-        print(f"\nResponse body:")
-        print(response.text)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if "choices" in data:
-                content = data["choices"][0]["message"]["content"]
-                print(f"\nMessage content:")
-                print(content)
+
+        if response.status_code != 200:
+            body = await response.aread()
+            print(f"\nResponse body:")
+            print(body.decode(errors="replace"))
+            return
+
+        content = ijson.sendable_list()
+        parser = ijson.items_coro(content, "choices.item.message.content")
+        async for chunk in response.aiter_bytes():
+            parser.send(chunk)
+            if content:
+                break
+        try:
+            parser.close()
+        except ijson.IncompleteJSONError:
+            # Expected when we stop before the document ends
+            pass
+
+    if content:
+        print(f"\nMessage content:")
+        print(content[0])
+    else:
+        print("\nNo message content found in response")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -7,15 +7,19 @@ Uses Google Gemini Flash via OpenRouter to analyze ticket sentiment.
 """
 
 import asyncio
+import hashlib
+import os
 import sys
-from pathlib import Path
 
-# Add backend to Python path
-backend_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(backend_dir))
+import orjson
 
-from src.services.openrouter import OpenRouterAnalyzer
-from src.core.config import settings
+from _bootstrap import settings, short
+from scripts._llm_cache import cache_json, get_cached_json
+from scripts._openrouter_http import client, provider_preferences, remember_provider, run
+
+# Tickets per OpenRouter request: one call analyzes a whole batch, so the
+# RTT and system-prompt tokenization are amortized across BATCH_SIZE tickets
+BATCH_SIZE = 5
 
 
 # Sample ticket data (realistic support ticket scenarios)
@@ -123,67 +127,164 @@ SAMPLE_TICKETS = [
 ]
 
 
+SYSTEM_PROMPT = (
+    "You are an expert at analyzing customer support tickets for sentiment "
+    "and churn risk. Always respond with valid JSON only."
+)
+
+
+def _batch_prompt(batch):
+    """Build one user message covering every ticket in the batch."""
+    numbered = "\n\n".join(
+        f"Ticket {i}:\nSubject: {t['subject']}\nContent: {t['content']}"
+        for i, t in enumerate(batch, 1)
+    )
+    return f"""Analyze the sentiment of the following {len(batch)} support tickets.
+
+Return a JSON object of this shape, with exactly one entry per ticket, in order:
+{{"results": [{{"index": 1, "sentiment": {{"score": "negative", "confidence": 0.85, "reasoning": "..."}}, "topics": [{{"name": "API Errors", "confidence": 0.9}}]}}]}}
+
+Valid sentiment scores: very_negative, negative, neutral, positive, very_positive.
+Suggest 2-3 topic categories per ticket.
+
+{numbered}"""
+
+
+def _strip_code_fences(content):
+    """Some models wrap JSON in ```json...``` despite json_object mode."""
+    content = content.strip()
+    if content.startswith("```"):
+        lines = content.split("\n")[1:]
+        if lines and lines[-1].strip() == "```":
+            lines = lines[:-1]
+        content = "\n".join(lines).strip()
+    return content
+
+
+async def analyze_batch(batch):
+    """Analyze one batch of tickets in a single OpenRouter request."""
+    prompt = _batch_prompt(batch)
+
+    if os.environ.get("CHURN_TEST_CACHE") == "1":
+        cached = get_cached_json(prompt)
+        if cached is not None:
+            return cached
+
+    response = await client.post(
+        "/chat/completions",
+        json={
+            "model": settings.OPENROUTER_MODEL,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "response_format": {"type": "json_object"},
+            "provider": provider_preferences()
+        }
+    )
+    response.raise_for_status()
+    remember_provider(response)
+
+    content = orjson.loads(response.content)["choices"][0]["message"]["content"]
+    entries = orjson.loads(_strip_code_fences(content))["results"]
+    if len(entries) != len(batch):
+        raise ValueError(
+            f"Expected {len(batch)} results, got {len(entries)}"
+        )
+
+    if os.environ.get("CHURN_TEST_CACHE") == "1":
+        cache_json(prompt, entries)
+
+    return entries
+
+
 async def analyze_tickets(tickets):
     """Analyze sentiment for each ticket using AI."""
     print(f"\n🤖 Analyzing {len(tickets)} sample tickets with AI...")
     print(f"   Model: {settings.OPENROUTER_MODEL}")
     print(f"   Provider: OpenRouter")
-    print(f"   Note: Adding 2-second delays between requests to avoid rate limits")
-
-    # Initialize analyzer (uses model from settings)
-    analyzer = OpenRouterAnalyzer()
-
+    print(f"   Note: Batching {BATCH_SIZE} tickets per request, batches in parallel")
+
+    # Dedupe identical subject+content before batching: templated replies
+    # and system-generated alerts repeat in real ticket streams, and each
+    # duplicate would otherwise burn an LLM slot for an identical answer
+    unique = []
+    key_to_pos = {}
+    ticket_keys = []
+    for t in tickets:
+        key = hashlib.blake2b(
+            f"{t['subject']}\n\n{t['content']}".encode(), digest_size=16
+        ).digest()
+        ticket_keys.append(key)
+        if key not in key_to_pos:
+            key_to_pos[key] = len(unique)
+            unique.append(t)
+
+    # One request per batch amortizes the HTTP round-trip and system prompt
+    # across BATCH_SIZE tickets; asyncio.gather still overlaps the batches
+    batches = [
+        unique[i:i + BATCH_SIZE] for i in range(0, len(unique), BATCH_SIZE)
+    ]
+    batch_analyses = await asyncio.gather(
+        *(analyze_batch(batch) for batch in batches),
+        return_exceptions=True
+    )
+
+    # Flatten to one entry (or exception) per unique ticket, then broadcast
+    # to every duplicate of that content
+    unique_results = []
+    for batch, analyses in zip(batches, batch_analyses):
+        if isinstance(analyses, Exception):
+            unique_results.extend([analyses] * len(batch))
+        else:
+            unique_results.extend(analyses)
+
+    # Buffer the per-ticket report and write it in one go rather than
+    # paying a stdout lock + flush per line
     results = []
-
+    lines = []
+    n = len(tickets)
     for i, ticket in enumerate(tickets, 1):
-        # Add delay to avoid rate limiting (except for first ticket)
-        if i > 1:
-            await asyncio.sleep(2)
         ticket_id = ticket.get("id")
         subject = ticket.get("subject")
-        content = ticket.get("content", "")
-
-        # Combine subject and content for analysis
-        full_text = f"{subject}\n\n{content}" if content else subject
-
-        print(f"\n[{i}/{len(tickets)}] Analyzing ticket {ticket_id}...")
-        print(f"   Subject: {subject[:60]}{'...' if len(subject) > 60 else ''}")
-
-        try:
-            # Analyze (no topics, just sentiment)
-            analysis = await analyzer.analyze_ticket(
-                ticket_content=full_text,
-                available_topics=None
-            )
-
-            sentiment = analysis.sentiment.sentiment.value
-            confidence = analysis.sentiment.confidence
-            is_negative = sentiment in ["negative", "very_negative"]
-
-            print(f"   Sentiment: {sentiment.upper()} (confidence: {confidence:.2f})")
-            if is_negative:
-                print(f"   ⚠️  NEGATIVE - potential churn risk")
+        entry = unique_results[key_to_pos[ticket_keys[i - 1]]]
 
-            results.append({
-                "ticket_id": ticket_id,
-                "subject": subject,
-                "sentiment": sentiment,
-                "confidence": confidence,
-                "is_negative": is_negative,
-                "reasoning": analysis.sentiment.reasoning,
-                "topics": [t.topic_name for t in analysis.topics]
-            })
+        lines.append(f"\n[{i}/{n}] Ticket {ticket_id}")
+        lines.append(f"   Subject: {short(subject)}")
 
-        except Exception as e:
-            print(f"   ❌ Error analyzing ticket: {e}")
+        if isinstance(entry, Exception):
+            # One cheap line per failure; the full traceback is reserved
+            # for the outermost handler in main(), which runs at most once
+            lines.append(f"   ❌ Error analyzing ticket: {type(entry).__name__}: {entry}")
             results.append({
                 "ticket_id": ticket_id,
                 "subject": subject,
                 "sentiment": "error",
                 "confidence": 0.0,
                 "is_negative": False,
-                "error": str(e)
+                "error": str(entry)
             })
+            continue
+
+        sentiment = entry["sentiment"]["score"]
+        confidence = entry["sentiment"]["confidence"]
+        is_negative = sentiment in ["negative", "very_negative"]
+
+        lines.append(f"   Sentiment: {sentiment.upper()} (confidence: {confidence:.2f})")
+        if is_negative:
+            lines.append(f"   ⚠️  NEGATIVE - potential churn risk")
+
+        results.append({
+            "ticket_id": ticket_id,
+            "subject": subject,
+            "sentiment": sentiment,
+            "confidence": confidence,
+            "is_negative": is_negative,
+            "reasoning": entry["sentiment"].get("reasoning"),
+            "topics": [t["name"] for t in entry.get("topics", [])]
+        })
+
+    print("\n".join(lines))
 
     return results
 
@@ -267,4 +368,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
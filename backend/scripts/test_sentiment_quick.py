@@ -2,14 +2,9 @@
 """Quick sentiment analysis test with 5 sample tickets."""
 
 import asyncio
-import sys
-from pathlib import Path
 
-backend_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(backend_dir))
-
-from src.services.openrouter import OpenRouterAnalyzer
-from src.core.config import settings
+from _bootstrap import OpenRouterAnalyzer, settings, short
+from scripts._llm_cache import cached_analyze
 
 # Just 5 diverse sample tickets
 SAMPLE_TICKETS = [
@@ -48,18 +43,27 @@ async def main():
 
     # Initialize analyzer (uses model from settings)
     analyzer = OpenRouterAnalyzer()
-    
+
+    # Precompute the analysis text up-front so the loop body only issues
+    # the API call
+    prepared = [
+        (t["id"], t["subject"], f"{t['subject']}\n\n{t['content']}".strip())
+        for t in SAMPLE_TICKETS
+    ]
+    n = len(prepared)
+
     results = []
-    
-    for i, ticket in enumerate(SAMPLE_TICKETS, 1):
+
+    for i, (ticket_id, subject, full_text) in enumerate(prepared, 1):
         if i > 1:
             await asyncio.sleep(3)  # 3 second delay between requests
-            
-        print(f"\n[{i}/5] {ticket['subject'][:50]}...")
-        
+
+        print(f"\n[{i}/{n}] {short(subject, 50)}")
+
         try:
-            analysis = await analyzer.analyze_ticket(
-                ticket_content=f"{ticket['subject']}\n\n{ticket['content']}",
+            analysis = await cached_analyze(
+                analyzer,
+                ticket_content=full_text,
                 available_topics=None
             )
             
@@ -72,16 +76,16 @@ async def main():
                 print(f"   ⚠️  CHURN RISK")
             
             results.append({
-                "id": ticket["id"],
-                "subject": ticket["subject"],
+                "id": ticket_id,
+                "subject": subject,
                 "sentiment": sentiment,
                 "confidence": confidence,
                 "is_negative": is_negative
             })
-            
+
         except Exception as e:
             print(f"   ❌ Error: {e}")
-            results.append({"id": ticket["id"], "sentiment": "error"})
+            results.append({"id": ticket_id, "sentiment": "error"})
     
     # Summary
     print("\n" + "="*70)
@@ -91,13 +95,13 @@ async def main():
     successful = [r for r in results if r["sentiment"] != "error"]
     negative = [r for r in successful if r.get("is_negative", False)]
     
-    print(f"\nAnalyzed: {len(successful)}/{len(SAMPLE_TICKETS)} tickets")
+    print(f"\nAnalyzed: {len(successful)}/{n} tickets")
     print(f"Churn Risk: {len(negative)} tickets")
     
     if negative:
         print("\n⚠️  Tickets flagged as churn risk:")
         for r in negative:
-            print(f"   • {r['id']}: {r['subject'][:50]}")
+            print(f"   • {r['id']}: {short(r['subject'], 50)}")
             print(f"     {r['sentiment'].upper()} ({r['confidence']:.0%} confidence)")
     
     print("\n✅ Test complete!")
@@ -11,16 +11,22 @@ This script checks:
 Exit code: 0 if all prompts valid, 1 if any errors found
 """
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-# Add project root to path so we can import the prompt engine
+# Add backend to Python path (idempotent, shared across scripts)
+import _bootstrap  # noqa: F401
+
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root / 'backend'))
 
 from src.prompt_engine import PromptLoader
 
-REQUIRED_FIELDS = ['name', 'version', 'description', 'variables']
+# frozensets so the membership checks below are single C-level
+# set-difference operations instead of per-field Python loops
+REQUIRED_FIELDS = frozenset({'name', 'version', 'description', 'variables'})
+REQUIRED_VARIABLE_FIELDS = frozenset({'name', 'type', 'required', 'description'})
 
 
 def validate_prompt(prompt_path: Path, loader: PromptLoader) -> list[str]:
@@ -43,21 +49,21 @@ def validate_prompt(prompt_path: Path, loader: PromptLoader) -> list[str]:
 
         # Check required metadata fields
         metadata = prompt_data['metadata']
-        for field in REQUIRED_FIELDS:
-            if field not in metadata:
-                errors.append(f"Missing required field: {field}")
+        errors.extend(
+            f"Missing required field: {field}"
+            for field in sorted(REQUIRED_FIELDS - metadata.keys())
+        )
 
         # Validate variable definitions
         variables = prompt_data.get('variables', [])
         for i, var_def in enumerate(variables):
-            if 'name' not in var_def:
+            missing = REQUIRED_VARIABLE_FIELDS - var_def.keys()
+            if 'name' in missing:
                 errors.append(f"Variable {i} missing 'name' field")
-            if 'type' not in var_def:
-                errors.append(f"Variable {i} ('{var_def.get('name', '?')}') missing 'type' field")
-            if 'required' not in var_def:
-                errors.append(f"Variable {i} ('{var_def.get('name', '?')}') missing 'required' field")
-            if 'description' not in var_def:
-                errors.append(f"Variable {i} ('{var_def.get('name', '?')}') missing 'description' field")
+            errors.extend(
+                f"Variable {i} ('{var_def.get('name', '?')}') missing '{field}' field"
+                for field in sorted(missing - {'name'})
+            )
 
         # Validate version format (semantic versioning)
         version = metadata.get('version', '')
@@ -76,33 +82,62 @@ def validate_prompt(prompt_path: Path, loader: PromptLoader) -> list[str]:
     return errors
 
 
+def _scandir_md(path):
+    """Yield .md files under path via os.scandir.
+
+    scandir reuses the directory entry's cached type information, so the
+    walk avoids the extra stat() per file that pathlib's rglob pays.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_md(entry.path)
+            elif entry.is_file(follow_symlinks=False) and entry.name.endswith('.md'):
+                yield entry
+
+
+def _validate_worker(path_str: str) -> tuple[str, list[str]]:
+    """Validate one prompt file; runs in a worker process."""
+    prompts_dir = project_root / 'prompts'
+    prompt_file = Path(path_str)
+    errors = validate_prompt(prompt_file, PromptLoader(str(prompts_dir)))
+    return str(prompt_file.relative_to(prompts_dir)), errors
+
+
 def main():
     """Validate all prompt files."""
     prompts_dir = project_root / 'prompts'
-    loader = PromptLoader(str(prompts_dir))
 
     print(f"Validating prompts in {prompts_dir}...")
     print()
 
-    all_errors = []
-    total_prompts = 0
-
-    # Find all .md files in prompts directory (skip README files)
-    for prompt_file in prompts_dir.rglob('*.md'):
-        # Skip README files (they're documentation, not prompts)
-        if prompt_file.name.upper() == 'README.MD':
-            continue
-
-        total_prompts += 1
-        errors = validate_prompt(prompt_file, loader)
+    # Find all .md files in prompts directory (skip README files —
+    # they're documentation, not prompts)
+    files = [
+        entry.path
+        for entry in _scandir_md(prompts_dir)
+        if entry.name.upper() != 'README.MD'
+    ]
+    total_prompts = len(files)
+
+    # Each file is independent and YAML parsing is CPU-bound, so fan the
+    # validation out across cores; results are printed here in order.
+    # --serial keeps a single-process path for debugging.
+    if '--serial' in sys.argv or total_prompts <= 1:
+        results = [_validate_worker(path) for path in files]
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(_validate_worker, files, chunksize=32))
 
+    all_errors = []
+    for relative_path, errors in results:
         if errors:
-            print(f"✗ {prompt_file.relative_to(prompts_dir)}")
+            print(f"✗ {relative_path}")
             for error in errors:
                 print(f"  - {error}")
             all_errors.extend(errors)
         else:
-            print(f"✓ {prompt_file.relative_to(prompts_dir)}")
+            print(f"✓ {relative_path}")
 
     print()
     print(f"Validated {total_prompts} prompt(s)")
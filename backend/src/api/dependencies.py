@@ -1,9 +1,64 @@
+from uuid import UUID
+
 from fastapi import Depends, HTTPException
 from sqlalchemy.orm import Session
 from src.core.database import get_db
 from src.core.auth import verify_firebase_token
-from src.models.user import User
-from typing import Dict
+from src.core.cache import cache_delete, cache_get_json, cache_set_json
+from src.models.user import User, UserRole
+from typing import Dict, Optional
+
+# Short TTL: the cached row carries tenant/role authorization state, so a
+# stale entry must age out quickly
+USER_CACHE_TTL_SECONDS = 60
+
+
+def _user_cache_key(firebase_uid: str) -> str:
+    return f"user:fbuid:{firebase_uid}"
+
+
+def get_user_by_firebase_uid(db: Session, firebase_uid: str) -> Optional[User]:
+    """Look up a user by Firebase UID through the Redis cache.
+
+    The identity row changes rarely but is read on every authenticated
+    request; a cache hit skips the Postgres round-trip. Misses (including
+    unknown UIDs) always go to the database.
+    """
+    cached = cache_get_json(_user_cache_key(firebase_uid))
+    if cached is not None:
+        return User(
+            id=UUID(cached["id"]),
+            tenant_id=UUID(cached["tenant_id"]),
+            firebase_uid=cached["firebase_uid"],
+            email=cached["email"],
+            name=cached["name"],
+            role=UserRole(cached["role"]),
+        )
+
+    user = db.query(User).filter(
+        User.firebase_uid == firebase_uid
+    ).first()
+
+    if user is not None:
+        cache_set_json(
+            _user_cache_key(firebase_uid),
+            {
+                "id": str(user.id),
+                "tenant_id": str(user.tenant_id),
+                "firebase_uid": user.firebase_uid,
+                "email": user.email,
+                "name": user.name,
+                "role": user.role.value,
+            },
+            USER_CACHE_TTL_SECONDS,
+        )
+
+    return user
+
+
+def invalidate_user_cache(firebase_uid: str) -> None:
+    """Drop a user's cached row; call after updating the user."""
+    cache_delete(_user_cache_key(firebase_uid))
 
 
 async def get_current_user(
@@ -16,9 +71,7 @@ async def get_current_user(
     Raises:
         HTTPException: If user not found in database.
     """
-    user = db.query(User).filter(
-        User.firebase_uid == token_data["uid"]
-    ).first()
+    user = get_user_by_firebase_uid(db, token_data["uid"])
 
     if not user:
         raise HTTPException(
@@ -33,8 +86,6 @@ async def require_admin(
     current_user: User = Depends(get_current_user)
 ) -> User:
     """Require user to have admin role."""
-    from src.models.user import UserRole
-
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(
             status_code=403,
@@ -1,4 +1,8 @@
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from firebase_admin import auth
 from src.core.database import get_db
@@ -14,18 +18,23 @@ from src.models.user import User, UserRole
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+def _subdomain_taken(db: Session, subdomain: str) -> bool:
+    """Existence check via SELECT 1; never materializes a Tenant row."""
+    exists_q = select(literal(1)).where(Tenant.subdomain == subdomain).exists()
+    return bool(db.scalar(select(exists_q)))
+
+
 @router.post("/check-subdomain", response_model=CheckSubdomainResponse)
 async def check_subdomain(
     request: CheckSubdomainRequest,
     db: Session = Depends(get_db)
 ):
     """Check if subdomain is available."""
-    existing = db.query(Tenant).filter(
-        Tenant.subdomain == request.subdomain
-    ).first()
-
+    # Sync Session query: run in the threadpool, same as the other
+    # blocking calls in this router
+    taken = await asyncio.to_thread(_subdomain_taken, db, request.subdomain)
     return CheckSubdomainResponse(
-        available=existing is None,
+        available=not taken,
         subdomain=request.subdomain
     )
 
@@ -36,50 +45,57 @@ async def register(
     db: Session = Depends(get_db)
 ):
     """Register a new user and create tenant."""
-    # Check subdomain availability
-    existing_tenant = db.query(Tenant).filter(
-        Tenant.subdomain == request.subdomain
-    ).first()
+    try:
+        # Claim the subdomain atomically: ON CONFLICT DO NOTHING returns no
+        # id when it is already taken, replacing the racy SELECT-then-INSERT
+        tenant_stmt = pg_insert(Tenant).values(
+            name=request.company_name,
+            subdomain=request.subdomain,
+            plan_tier=PlanTier.STARTER
+        ).on_conflict_do_nothing(
+            index_elements=["subdomain"]
+        ).returning(Tenant.id)
 
-    if existing_tenant:
-        raise HTTPException(
-            status_code=400,
-            detail="Subdomain already taken. Please choose another."
-        )
+        # Like the Firebase call and commit below, the sync Session query
+        # would otherwise block the event loop
+        result = await asyncio.to_thread(db.execute, tenant_stmt)
+        tenant_id = result.scalar()
+        if tenant_id is None:
+            raise HTTPException(
+                status_code=400,
+                detail="Subdomain already taken. Please choose another."
+            )
 
-    try:
-        # Create Firebase user
-        firebase_user = auth.create_user(
+        # Create the Firebase user only after the subdomain is secured, so a
+        # taken subdomain never leaves an orphaned Firebase account behind.
+        # The Admin SDK call is a blocking HTTPS request; run it in the
+        # threadpool so it does not stall the event loop
+        firebase_user = await asyncio.to_thread(
+            auth.create_user,
             email=request.email,
             password=request.password,
             display_name=request.name
         )
 
-        # Create tenant
-        tenant = Tenant(
-            name=request.company_name,
-            subdomain=request.subdomain,
-            plan_tier=PlanTier.STARTER
-        )
-        db.add(tenant)
-        db.flush()  # Get tenant ID before creating user
-
         # Create user
         user = User(
-            tenant_id=tenant.id,
+            tenant_id=tenant_id,
             firebase_uid=firebase_user.uid,
             email=request.email,
             name=request.name,
             role=UserRole.ADMIN
         )
         db.add(user)
-        db.commit()
+        await asyncio.to_thread(db.commit)
 
         return RegisterResponse(
             message="Registration successful. Please log in.",
             email=request.email
         )
 
+    except HTTPException:
+        db.rollback()
+        raise
     except auth.EmailAlreadyExistsError:
         db.rollback()
         raise HTTPException(
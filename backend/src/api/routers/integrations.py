@@ -1,15 +1,59 @@
+import asyncio
+import base64
+import hmac
+import time
+from hashlib import sha256
+from urllib.parse import urlencode
+from uuid import UUID
+
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
+from src.core.config import settings
 from src.core.database import get_db
+from src.core.cache import cache_delete, cache_get_json, cache_set_json
 from src.api.dependencies import get_current_user, require_admin
 from src.models.user import User
 from src.models.integration import Integration, IntegrationType, IntegrationStatus
-from src.schemas.integration import IntegrationResponse, HubSpotOAuthCallbackRequest
+from src.schemas.integration import IntegrationResponse
 from src.integrations.hubspot import HubSpotClient
-from datetime import datetime
 
 router = APIRouter(prefix="/integrations", tags=["integrations"])
 
+# The dashboard polls this list but it only changes on connect/delete.
+# Key includes tenant_id: never share cached rows across tenants.
+INTEGRATIONS_CACHE_TTL_SECONDS = 60
+
+
+def _integrations_cache_key(tenant_id) -> str:
+    return f"integrations:tenant:{tenant_id}"
+
+
+# The authorize URL only varies in the per-request state token, so the
+# static query portion is encoded once at import
+_HUBSPOT_AUTHORIZE_BASE = "https://app.hubspot.com/oauth/authorize?" + urlencode({
+    "client_id": settings.HUBSPOT_CLIENT_ID,
+    "redirect_uri": settings.HUBSPOT_REDIRECT_URI,
+    "scope": "crm.objects.contacts.read crm.objects.companies.read tickets sales-email-read",
+})
+
+# Static pieces of the HS256 state token, computed once: PyJWT re-derives
+# the header and key object on every encode
+_STATE_TTL_SECONDS = 15 * 60
+_JWT_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+_HMAC_KEY = settings.SECRET_KEY.encode()
+
+
+def _encode_state(payload: dict) -> str:
+    """HS256-sign the OAuth state payload; jwt.decode can verify the result."""
+    signing_input = _JWT_HEADER_B64 + b"." + base64.urlsafe_b64encode(
+        orjson.dumps(payload)
+    ).rstrip(b"=")
+    signature = hmac.new(_HMAC_KEY, signing_input, sha256).digest()
+    return (
+        signing_input + b"." + base64.urlsafe_b64encode(signature).rstrip(b"=")
+    ).decode()
+
 
 @router.get("", response_model=list[IntegrationResponse])
 async def list_integrations(
@@ -17,11 +61,16 @@ async def list_integrations(
     current_user: User = Depends(get_current_user)
 ):
     """List all integrations for the current tenant."""
+    cache_key = _integrations_cache_key(current_user.tenant_id)
+    cached = cache_get_json(cache_key)
+    if cached is not None:
+        return [IntegrationResponse(**item) for item in cached]
+
     integrations = db.query(Integration).filter(
         Integration.tenant_id == current_user.tenant_id
     ).all()
 
-    return [
+    responses = [
         IntegrationResponse(
             id=str(integration.id),
             type=integration.type,
@@ -32,36 +81,29 @@ async def list_integrations(
         for integration in integrations
     ]
 
+    cache_set_json(
+        cache_key,
+        [response.model_dump(mode="json") for response in responses],
+        INTEGRATIONS_CACHE_TTL_SECONDS,
+    )
+
+    return responses
+
 
 @router.get("/hubspot/authorize")
 async def hubspot_authorize_url(
     current_user: User = Depends(require_admin)
 ):
     """Get HubSpot OAuth authorization URL with state parameter."""
-    from src.core.config import settings
-    import jwt
-    from datetime import timedelta
-
     # Create state token with tenant_id
-    state_payload = {
+    state = _encode_state({
         "tenant_id": str(current_user.tenant_id),
         "user_id": str(current_user.id),
-        "exp": datetime.utcnow() + timedelta(minutes=15)  # State expires in 15 minutes
-    }
-    state = jwt.encode(state_payload, settings.SECRET_KEY, algorithm="HS256")
-
-    from urllib.parse import urlencode
+        "exp": int(time.time()) + _STATE_TTL_SECONDS
+    })
 
-    # URL-encode parameters properly
-    params = {
-        "client_id": settings.HUBSPOT_CLIENT_ID,
-        "redirect_uri": settings.HUBSPOT_REDIRECT_URI,
-        "scope": "crm.objects.contacts.read crm.objects.companies.read tickets sales-email-read",
-        "state": state
-    }
-    auth_url = f"https://app.hubspot.com/oauth/authorize?{urlencode(params)}"
-
-    return {"authorization_url": auth_url}
+    # JWTs are base64url-encoded, so the state needs no further escaping
+    return {"authorization_url": f"{_HUBSPOT_AUTHORIZE_BASE}&state={state}"}
 
 
 @router.get("/hubspot/callback")
@@ -76,11 +118,9 @@ async def hubspot_oauth_callback(
     This endpoint is public (no auth required) because it's called by HubSpot's redirect.
     It uses the 'state' parameter to validate the request and identify the user's tenant.
     """
-    from src.core.config import settings
-    from src.models.tenant import Tenant
     from fastapi.responses import RedirectResponse
+    from sqlalchemy.exc import IntegrityError
     import jwt
-    from uuid import UUID
 
     try:
         # Validate state parameter
@@ -96,10 +136,8 @@ async def hubspot_oauth_callback(
         except (jwt.InvalidTokenError, KeyError, ValueError) as e:
             raise HTTPException(status_code=400, detail="Invalid state parameter")
 
-        # Get the tenant
-        tenant = db.query(Tenant).filter(Tenant.id == tenant_id).first()
-        if not tenant:
-            raise HTTPException(status_code=404, detail="Tenant not found")
+        # The signed state already authenticates tenant_id, so no existence
+        # SELECT: the Integration foreign key rejects stale tenants below
 
         # Exchange code for access token
         token_data = await HubSpotClient.exchange_code_for_token(
@@ -109,7 +147,7 @@ async def hubspot_oauth_callback(
 
         # Check if integration already exists for this tenant
         existing = db.query(Integration).filter(
-            Integration.tenant_id == tenant.id,
+            Integration.tenant_id == tenant_id,
             Integration.type == IntegrationType.HUBSPOT
         ).first()
 
@@ -122,39 +160,46 @@ async def hubspot_oauth_callback(
         else:
             # Create new integration
             integration = Integration(
-                tenant_id=tenant.id,
+                tenant_id=tenant_id,
                 type=IntegrationType.HUBSPOT,
                 status=IntegrationStatus.ACTIVE,
                 credentials=token_data
             )
             db.add(integration)
 
-        db.commit()
-        db.refresh(integration)
+        try:
+            # Keep the sync session's round-trips off the event loop
+            await asyncio.to_thread(db.commit)
+        except IntegrityError:
+            # tenant was deleted after the state token was issued
+            db.rollback()
+            raise HTTPException(status_code=404, detail="Tenant not found")
+        await asyncio.to_thread(db.refresh, integration)
+
+        # The integration list for this tenant just changed
+        cache_delete(_integrations_cache_key(tenant_id))
 
         # Redirect to frontend dashboard with success
-        frontend_url = settings.CORS_ORIGINS.split(",")[0] if settings.CORS_ORIGINS else "http://localhost:3000"
+        frontend_url = settings.cors_origins_list[0] if settings.CORS_ORIGINS else "http://localhost:3000"
         return RedirectResponse(url=f"{frontend_url}/dashboard?hubspot=connected")
 
     except HTTPException:
         raise
     except Exception as e:
         # Redirect to frontend with error
-        frontend_url = settings.CORS_ORIGINS.split(",")[0] if settings.CORS_ORIGINS else "http://localhost:3000"
+        frontend_url = settings.cors_origins_list[0] if settings.CORS_ORIGINS else "http://localhost:3000"
         return RedirectResponse(url=f"{frontend_url}/dashboard?hubspot=error&message={str(e)}")
 
 
 @router.delete("/{integration_id}")
 async def delete_integration(
-    integration_id: str,
+    integration_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
     """Delete an integration."""
-    from uuid import UUID
-
     integration = db.query(Integration).filter(
-        Integration.id == UUID(integration_id),
+        Integration.id == integration_id,
         Integration.tenant_id == current_user.tenant_id
     ).first()
 
@@ -164,4 +209,6 @@ async def delete_integration(
     db.delete(integration)
     db.commit()
 
+    cache_delete(_integrations_cache_key(current_user.tenant_id))
+
     return {"message": "Integration deleted successfully"}
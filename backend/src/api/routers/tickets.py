@@ -1,7 +1,7 @@
 """Ticket API endpoints."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, raiseload, selectinload
 from sqlalchemy import select, func
 from src.core.database import get_db
 from src.api.dependencies import get_current_user
@@ -88,68 +88,75 @@ async def list_tickets(
     Returns:
         TicketListResponse with list of tickets and total count
     """
-    # Build base query with eager loading to prevent N+1 queries
-    query = select(Ticket).where(
+    # Build base query with eager loading to prevent N+1 queries.
+    # The COUNT(*) OVER () window function carries the pre-pagination total
+    # on every row, so a single round-trip replaces the count+fetch pair.
+    query = select(
+        Ticket,
+        func.count().over().label("total_count")
+    ).where(
         Ticket.tenant_id == current_user.tenant_id
     ).options(
-        joinedload(Ticket.company),
-        joinedload(Ticket.contact)
+        selectinload(Ticket.company),
+        selectinload(Ticket.contact),
+        # Any other relationship touched during serialization would be a
+        # silent N+1; raise instead so it gets caught in development
+        raiseload("*")
     )
 
     # Apply sentiment filter if provided
     if sentiment:
         query = query.where(Ticket.sentiment_score == sentiment)
 
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total = db.execute(count_query).scalar_one()
-
     # Apply ordering, pagination
     query = query.order_by(Ticket.created_at.desc()).offset(offset).limit(limit)
 
     # Execute query
-    result = db.execute(query)
-    tickets = result.scalars().all()
-
-    # Convert to response schema
-    ticket_responses = []
-    for ticket in tickets:
-        # Build company response if exists
-        company_response = None
-        if ticket.company:
-            company_response = CompanyResponse(
+    rows = db.execute(query).all()
+    tickets = [row[0] for row in rows]
+    if rows:
+        total = rows[0][1]
+    elif offset:
+        # A page past the end returns no rows, so no window-function total
+        # either - fall back to a COUNT so clients still see the real total
+        count_query = select(func.count()).where(
+            Ticket.tenant_id == current_user.tenant_id
+        )
+        if sentiment:
+            count_query = count_query.where(Ticket.sentiment_score == sentiment)
+        total = db.scalar(count_query) or 0
+    else:
+        total = 0
+
+    # Convert to response schema. The rows come straight from our own
+    # database, so model_construct skips redundant pydantic validation.
+    ticket_responses = [
+        TicketResponse.model_construct(
+            id=str(ticket.id),
+            external_id=ticket.external_id,
+            subject=ticket.subject,
+            content=ticket.content,
+            sentiment_score=ticket.sentiment_score,
+            sentiment_confidence=ticket.sentiment_confidence,
+            sentiment_analyzed_at=ticket.sentiment_analyzed_at,
+            created_at=ticket.created_at,
+            hubspot_created_at=ticket.hubspot_created_at,
+            hubspot_updated_at=ticket.hubspot_updated_at,
+            priority=ticket.priority,
+            status=ticket.status,
+            company=CompanyResponse.model_construct(
                 id=str(ticket.company.id),
                 name=ticket.company.name
-            )
-
-        # Build contact response if exists
-        contact_response = None
-        if ticket.contact:
-            contact_response = ContactResponse(
+            ) if ticket.company else None,
+            contact=ContactResponse.model_construct(
                 id=str(ticket.contact.id),
                 name=ticket.contact.name,
                 email=ticket.contact.email
-            )
-
-        ticket_responses.append(
-            TicketResponse(
-                id=str(ticket.id),
-                external_id=ticket.external_id,
-                subject=ticket.subject,
-                content=ticket.content,
-                sentiment_score=ticket.sentiment_score,
-                sentiment_confidence=ticket.sentiment_confidence,
-                sentiment_analyzed_at=ticket.sentiment_analyzed_at,
-                created_at=ticket.created_at,
-                hubspot_created_at=ticket.hubspot_created_at,
-                hubspot_updated_at=ticket.hubspot_updated_at,
-                priority=ticket.priority,
-                status=ticket.status,
-                company=company_response,
-                contact=contact_response,
-                external_url=ticket.external_url
-            )
+            ) if ticket.contact else None,
+            external_url=ticket.external_url
         )
+        for ticket in tickets
+    ]
 
     return TicketListResponse(
         tickets=ticket_responses,
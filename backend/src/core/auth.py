@@ -1,5 +1,10 @@
+import asyncio
+import hashlib
 import os
+import time
 import firebase_admin
+import jwt
+from cachetools import TTLCache
 from firebase_admin import auth, credentials
 from fastapi import HTTPException, Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -14,6 +19,13 @@ if not firebase_admin._apps and settings.FIREBASE_CREDENTIALS_PATH and os.path.e
 
 security = HTTPBearer()
 
+# The same ID token repeats on every request a client makes for up to an
+# hour, so cache verified claims briefly instead of re-running signature
+# verification each time. Keys are token hashes to bound entry size; each
+# entry also records the token's own exp so we never outlive it.
+_TOKEN_CACHE_TTL_SECONDS = 300
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=_TOKEN_CACHE_TTL_SECONDS)
+
 
 async def verify_firebase_token(
     credentials: HTTPAuthorizationCredentials = Security(security)
@@ -29,12 +41,48 @@ async def verify_firebase_token(
     """
     token = credentials.credentials
 
+    # Cheap structural guard: reject garbage before any hashing or RSA
+    # work. Firebase ID tokens are three base64url segments signed RS256.
+    if token.count(".") != 2 or len(token) > 4096:
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid authentication token"
+        )
     try:
-        decoded_token = auth.verify_id_token(token)
-        return {
+        if jwt.get_unverified_header(token).get("alg") != "RS256":
+            raise HTTPException(
+                status_code=401,
+                detail="Invalid authentication token"
+            )
+    except jwt.DecodeError:
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid authentication token"
+        )
+
+    cache_key = hashlib.sha256(token.encode()).digest()
+    cached = _token_cache.get(cache_key)
+    if cached is not None:
+        claims, expires_at = cached
+        if time.time() < expires_at:
+            return claims
+
+    try:
+        # verify_id_token may fetch signing keys over HTTPS; keep that sync
+        # work off the event loop
+        decoded_token = await asyncio.to_thread(auth.verify_id_token, token)
+        claims = {
             "uid": decoded_token["uid"],
             "email": decoded_token.get("email", ""),
         }
+        now = time.time()
+        expires_at = min(
+            now + _TOKEN_CACHE_TTL_SECONDS,
+            decoded_token.get("exp", now + _TOKEN_CACHE_TTL_SECONDS),
+        )
+        if expires_at > now:
+            _token_cache[cache_key] = (claims, expires_at)
+        return claims
     except auth.ExpiredIdTokenError:
         raise HTTPException(
             status_code=401,
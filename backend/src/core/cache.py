@@ -0,0 +1,60 @@
+"""Best-effort Redis cache helpers.
+
+The cache is optional: when REDIS_URL is unset, or Redis is unreachable,
+every helper degrades to a miss/no-op so request handling never depends
+on Redis availability.
+"""
+
+from functools import lru_cache
+from typing import Any, Optional
+
+import orjson
+import redis
+
+from src.core.config import settings
+
+
+@lru_cache(maxsize=1)
+def get_redis() -> Optional[redis.Redis]:
+    """Return the shared Redis client, or None when caching is disabled."""
+    if not settings.REDIS_URL:
+        return None
+    return redis.Redis.from_url(
+        settings.REDIS_URL,
+        socket_timeout=0.5,
+        socket_connect_timeout=0.5,
+    )
+
+
+def cache_get_json(key: str) -> Any:
+    """Fetch and deserialize a cached value, or None on miss/error."""
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        payload = client.get(key)
+    except (redis.RedisError, OSError):
+        return None
+    return orjson.loads(payload) if payload else None
+
+
+def cache_set_json(key: str, payload: Any, ttl_seconds: int) -> None:
+    """Serialize and store a value with a TTL, best-effort."""
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.setex(key, ttl_seconds, orjson.dumps(payload))
+    except (redis.RedisError, OSError):
+        pass
+
+
+def cache_delete(key: str) -> None:
+    """Drop a cached value, best-effort."""
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.delete(key)
+    except (redis.RedisError, OSError):
+        pass
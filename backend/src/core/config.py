@@ -1,16 +1,34 @@
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from typing import List, Optional
 from dotenv import load_dotenv
 import os
 
-# Explicitly load .env file before Settings class is instantiated
+# Explicitly load .env file before Settings is instantiated
 # Use override=True to ensure .env values take precedence over shell environment variables
 env_path = os.path.join(os.path.dirname(__file__), '..', '..', '.env')
 load_dotenv(env_path, override=True)
 
+# Fields that must be present (and non-empty) in the environment
+_REQUIRED_VARS = (
+    "DATABASE_URL",
+    "FIREBASE_PROJECT_ID",
+    "OPENROUTER_API_KEY",
+    "HUBSPOT_CLIENT_ID",
+    "HUBSPOT_CLIENT_SECRET",
+    "HUBSPOT_REDIRECT_URI",
+    "SECRET_KEY",
+)
 
-class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
+
+@dataclass(frozen=True)
+class Settings:
+    """Application settings loaded from environment variables.
+
+    A plain frozen dataclass rather than pydantic-settings: the fields are
+    all strings with defaults, and skipping the pydantic-settings import
+    shaves cold-start time per Cloud Run instance.
+    """
 
     # Database
     DATABASE_URL: str
@@ -20,32 +38,59 @@ class Settings(BaseSettings):
     FIREBASE_CREDENTIALS_PATH: Optional[str] = None  # Only for local dev
 
     # OpenRouter
-    OPENROUTER_API_KEY: str
+    OPENROUTER_API_KEY: str = ""
     OPENROUTER_MODEL: str = "google/gemini-2.5-flash"  # Default model
 
     # HubSpot OAuth
-    HUBSPOT_CLIENT_ID: str
-    HUBSPOT_CLIENT_SECRET: str
-    HUBSPOT_REDIRECT_URI: str
+    HUBSPOT_CLIENT_ID: str = ""
+    HUBSPOT_CLIENT_SECRET: str = ""
+    HUBSPOT_REDIRECT_URI: str = ""
+
+    # Redis (optional - caching degrades to no-op when unset)
+    REDIS_URL: Optional[str] = None
 
     # App
     ENVIRONMENT: str = "development"
-    SECRET_KEY: str
+    SECRET_KEY: str = ""
     API_V1_PREFIX: str = "/api/v1"
     CORS_ORIGINS: str = "http://localhost:3000"
 
     # GCP
-    GOOGLE_CLOUD_PROJECT: str | None = None
+    GOOGLE_CLOUD_PROJECT: Optional[str] = None
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        case_sensitive=True,
-        extra="ignore"
-    )
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Build Settings from os.environ, failing fast on missing vars."""
+        env = os.environ
+        missing = [name for name in _REQUIRED_VARS if not env.get(name)]
+        if missing:
+            raise ValueError(
+                f"Missing required environment variables: {', '.join(missing)}"
+            )
+        return cls(
+            DATABASE_URL=env["DATABASE_URL"],
+            FIREBASE_PROJECT_ID=env["FIREBASE_PROJECT_ID"],
+            FIREBASE_CREDENTIALS_PATH=env.get("FIREBASE_CREDENTIALS_PATH") or None,
+            OPENROUTER_API_KEY=env["OPENROUTER_API_KEY"],
+            OPENROUTER_MODEL=env.get("OPENROUTER_MODEL") or "google/gemini-2.5-flash",
+            HUBSPOT_CLIENT_ID=env["HUBSPOT_CLIENT_ID"],
+            HUBSPOT_CLIENT_SECRET=env["HUBSPOT_CLIENT_SECRET"],
+            HUBSPOT_REDIRECT_URI=env["HUBSPOT_REDIRECT_URI"],
+            REDIS_URL=env.get("REDIS_URL") or None,
+            ENVIRONMENT=env.get("ENVIRONMENT") or "development",
+            SECRET_KEY=env["SECRET_KEY"],
+            API_V1_PREFIX=env.get("API_V1_PREFIX") or "/api/v1",
+            CORS_ORIGINS=env.get("CORS_ORIGINS") or "http://localhost:3000",
+            GOOGLE_CLOUD_PROJECT=env.get("GOOGLE_CLOUD_PROJECT") or None,
+        )
 
-    def get_firebase_credentials(self) -> dict:
-        """
-        Get Firebase credentials from file (local) or Secret Manager (production).
+    @cached_property
+    def firebase_credentials(self) -> dict:
+        """Firebase credentials, resolved lazily on first access.
+
+        Reads the local file in development; in production the Secret
+        Manager RPC happens here — never at Settings construction — and
+        the parsed dict is cached for the life of the process.
         """
         # Local development - use file
         if self.ENVIRONMENT == "development" and self.FIREBASE_CREDENTIALS_PATH:
@@ -58,9 +103,25 @@ class Settings(BaseSettings):
         sm = get_secret_manager()
         return sm.get_json_secret("firebase-credentials")
 
-    def get_cors_origins_list(self) -> List[str]:
-        """Parse CORS_ORIGINS string into list."""
+    def get_firebase_credentials(self) -> dict:
+        """Kept for existing callers; delegates to the cached property."""
+        return self.firebase_credentials
+
+    @cached_property
+    def cors_origins_list(self) -> List[str]:
+        """CORS_ORIGINS parsed once; later accesses are attribute lookups."""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the Settings object exactly once per process.
+
+    from_env checks every required field at construction, so callers that
+    need a settings instance (e.g. as a FastAPI dependency) should go
+    through this instead of instantiating Settings again.
+    """
+    return Settings.from_env()
+
+
+settings = get_settings()
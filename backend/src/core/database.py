@@ -1,12 +1,34 @@
-from sqlalchemy import create_engine
+import sqlite3
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 from src.core.config import settings
 
+
+@event.listens_for(Engine, "connect")
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """Turn on FK enforcement for SQLite connections (tests/CI).
+
+    The models rely on database-level ON DELETE CASCADE instead of ORM
+    cascades (passive_deletes), and SQLite ships with foreign_keys off.
+    """
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+# Module-level engine lives for the whole process, so the compiled-SQL
+# cache below survives across requests. 1200 slots comfortably holds every
+# distinct statement shape this app emits; the default (500) can thrash
+# once per-tenant filters and migrations mix in.
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    query_cache_size=1200,
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -1,10 +1,16 @@
 """Secret Manager integration for production secrets."""
 
 import os
-import json
+import threading
+
+import orjson
 from typing import Optional
+from cachetools import TTLCache
 from google.cloud import secretmanager
-from functools import lru_cache
+
+# Secrets rotated in GCP should be picked up without a pod restart, so
+# cached values expire after this many seconds
+_SECRET_TTL_SECONDS = 600
 
 
 class SecretManager:
@@ -18,12 +24,19 @@ class SecretManager:
 
         self.client = secretmanager.SecretManagerServiceClient()
 
-    @lru_cache(maxsize=32)
+        # TTL cache bounds staleness; _last_good keeps serving the previous
+        # value if a refresh RPC fails after expiry
+        self._cache: TTLCache = TTLCache(maxsize=32, ttl=_SECRET_TTL_SECONDS)
+        self._last_good: dict = {}
+        self._lock = threading.Lock()
+
     def get_secret(self, secret_id: str, version: str = "latest") -> str:
         """
         Retrieve a secret from Secret Manager.
 
-        Uses LRU cache to avoid repeated API calls.
+        Cached with a TTL so "latest" picks up rotated values within
+        _SECRET_TTL_SECONDS instead of pinning the first fetch forever.
+        If a refresh fails, the last known-good value is served.
 
         Args:
             secret_id: Name of the secret
@@ -32,18 +45,41 @@ class SecretManager:
         Returns:
             Secret value as string
         """
+        key = (secret_id, version)
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
         name = f"projects/{self.project_id}/secrets/{secret_id}/versions/{version}"
 
         try:
             response = self.client.access_secret_version(request={"name": name})
-            return response.payload.data.decode("UTF-8")
+            value = response.payload.data.decode("UTF-8")
         except Exception as e:
+            with self._lock:
+                stale = self._last_good.get(key)
+            if stale is not None:
+                # Bounded staleness beats failing the request outright
+                return stale
             raise RuntimeError(f"Failed to access secret {secret_id}: {e}")
 
+        with self._lock:
+            self._cache[key] = value
+            self._last_good[key] = value
+        return value
+
+    def invalidate(self, secret_id: str, version: str = "latest") -> None:
+        """Force the next get_secret call to hit Secret Manager."""
+        key = (secret_id, version)
+        with self._lock:
+            self._cache.pop(key, None)
+            self._last_good.pop(key, None)
+
     def get_json_secret(self, secret_id: str) -> dict:
         """Retrieve a secret and parse as JSON."""
         secret_value = self.get_secret(secret_id)
-        return json.loads(secret_value)
+        return orjson.loads(secret_value)
 
 
 # Singleton instance
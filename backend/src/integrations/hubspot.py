@@ -1,14 +1,95 @@
+import asyncio
+import time
+
 import httpx
-from typing import Dict, List, Any
+import orjson
+from cachetools import LRUCache
+from operator import itemgetter
+from typing import Any, AsyncIterator, Dict, List
 from datetime import datetime
 from src.core.config import settings
 
 
+def _email_sort_ts(email: Dict[str, Any]) -> int:
+    """Email sort key in epoch milliseconds; 0 when absent or unparseable.
+
+    hs_timestamp arrives either as epoch millis or an ISO-8601 string
+    depending on the endpoint.
+    """
+    ts = email.get("properties", {}).get("hs_timestamp")
+    if not ts:
+        return 0
+    try:
+        return int(ts)
+    except ValueError:
+        pass
+    try:
+        return int(datetime.fromisoformat(ts.rstrip("Z")).timestamp() * 1000)
+    except ValueError:
+        return 0
+
+# OAuth credentials never change within a process, so the constant part of
+# the token-exchange form body is built once
+_OAUTH_BASE = {
+    "client_id": settings.HUBSPOT_CLIENT_ID,
+    "client_secret": settings.HUBSPOT_CLIENT_SECRET,
+}
+
+# Shared client for OAuth token calls: keeps TCP/TLS connections warm across
+# callbacks instead of re-handshaking with HubSpot on every exchange.
+# Created lazily so importing the module never opens sockets.
+_oauth_client: httpx.AsyncClient | None = None
+
+
+def _get_oauth_client() -> httpx.AsyncClient:
+    global _oauth_client
+    if _oauth_client is None or _oauth_client.is_closed:
+        _oauth_client = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            # No proxy/netrc env scanning on a server-to-server client
+            trust_env=False,
+        )
+    return _oauth_client
+
+
+async def close_oauth_client() -> None:
+    """Close the shared OAuth client; called from app shutdown."""
+    if _oauth_client is not None and not _oauth_client.is_closed:
+        await _oauth_client.aclose()
+
+
 class HubSpotClient:
     """Client for interacting with HubSpot API."""
 
     BASE_URL = "https://api.hubapi.com"
 
+    # HubSpot batch-read endpoints accept at most 100 ids per request
+    BATCH_READ_LIMIT = 100
+
+    # Default property sets, built once at class definition rather than as
+    # fresh list literals on every call
+    DEFAULT_TICKET_PROPERTIES: tuple = (
+        "subject",
+        "content",
+        "hs_ticket_id",
+        "hs_ticket_priority",
+        "hs_pipeline_stage",
+        "createdate",
+        "hs_lastmodifieddate",
+    )
+
+    EMAIL_PROPERTIES: tuple = (
+        "hs_email_subject",
+        "hs_email_text",
+        "hs_email_html",
+        "hs_timestamp",
+        "hs_email_direction",
+        "hs_email_from",
+        "hs_email_to",
+    )
+
     def __init__(self, access_token: str):
         """
         Initialize HubSpot client with OAuth access token.
@@ -20,6 +101,64 @@ class HubSpotClient:
             "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json",
         }
+        # One pooled connection per client instance: every API call reuses
+        # warm TCP/TLS connections and HTTP/2 multiplexing instead of
+        # re-handshaking per request
+        self._client = httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            headers=self.headers,
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            # Skip per-client proxy/netrc environment scanning
+            trust_env=False,
+        )
+        # ETag -> payload per (path, params): polled list endpoints mostly
+        # return unchanged data, so If-None-Match lets HubSpot answer 304
+        # with no body and we skip the JSON parse
+        self._etag_cache: LRUCache = LRUCache(maxsize=64)
+
+    async def _get_with_etag(self, path: str, params: Dict[str, Any] | None = None) -> Dict[str, Any]:
+        """GET with conditional-request support.
+
+        Sends If-None-Match when a previous response for the same path and
+        params carried an ETag; a 304 reply returns the cached payload
+        without re-parsing.
+        """
+        key = (path, orjson.dumps(params, option=orjson.OPT_SORT_KEYS) if params else b"")
+        cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        response = await self._client.get(path, params=params, headers=headers)
+        if cached and response.status_code == 304:
+            return cached[1]
+        response.raise_for_status()
+
+        payload = orjson.loads(response.content)
+        etag = response.headers.get("etag")
+        if etag:
+            self._etag_cache[key] = (etag, payload)
+        return payload
+
+    def set_access_token(self, access_token: str) -> None:
+        """
+        Swap the OAuth access token on an existing client.
+
+        Lets callers keep the same client (and its connections) across a
+        token refresh instead of constructing a new one.
+        """
+        self.headers["Authorization"] = f"Bearer {access_token}"
+        self._client.headers["Authorization"] = self.headers["Authorization"]
+
+    async def aclose(self) -> None:
+        """Close the pooled connections held by this client."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "HubSpotClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
 
     @classmethod
     async def exchange_code_for_token(cls, code: str, redirect_uri: str) -> Dict[str, Any]:
@@ -29,19 +168,17 @@ class HubSpotClient:
         Returns:
             Dict with 'access_token', 'refresh_token', 'expires_in'
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.hubapi.com/oauth/v1/token",
-                data={
-                    "grant_type": "authorization_code",
-                    "client_id": settings.HUBSPOT_CLIENT_ID,
-                    "client_secret": settings.HUBSPOT_CLIENT_SECRET,
-                    "redirect_uri": redirect_uri,
-                    "code": code,
-                },
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await _get_oauth_client().post(
+            "https://api.hubapi.com/oauth/v1/token",
+            data={
+                **_OAUTH_BASE,
+                "grant_type": "authorization_code",
+                "redirect_uri": redirect_uri,
+                "code": code,
+            },
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
     @classmethod
     async def refresh_access_token(cls, refresh_token: str) -> Dict[str, Any]:
@@ -51,18 +188,41 @@ class HubSpotClient:
         Returns:
             Dict with new 'access_token', 'refresh_token', 'expires_in'
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.hubapi.com/oauth/v1/token",
-                data={
-                    "grant_type": "refresh_token",
-                    "client_id": settings.HUBSPOT_CLIENT_ID,
-                    "client_secret": settings.HUBSPOT_CLIENT_SECRET,
-                    "refresh_token": refresh_token,
-                },
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await _get_oauth_client().post(
+            "https://api.hubapi.com/oauth/v1/token",
+            data={
+                **_OAUTH_BASE,
+                "grant_type": "refresh_token",
+                "refresh_token": refresh_token,
+            },
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    # refresh_token -> (token_data, expiry). Shared across instances so
+    # concurrent imports for the same integration reuse one refresh RPC;
+    # LRU-bounded so departed tenants don't accumulate entries forever.
+    _access_tokens: LRUCache = LRUCache(maxsize=256)
+
+    @classmethod
+    async def get_valid_access_token(cls, refresh_token: str, force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        Return cached token data, refreshing only when near expiry.
+
+        Tokens are reused until 60 seconds before HubSpot's reported
+        expires_in elapses, so steady-state API work skips the refresh
+        round-trip entirely. Pass force_refresh=True after a 401 - the
+        server has already rejected whatever the cache holds.
+        """
+        if not force_refresh:
+            cached = cls._access_tokens.get(refresh_token)
+            if cached and cached[1] > time.time():
+                return cached[0]
+
+        token_data = await cls.refresh_access_token(refresh_token)
+        expiry = time.time() + token_data.get("expires_in", 0) - 60
+        cls._access_tokens[refresh_token] = (token_data, expiry)
+        return token_data
 
     async def search_tickets(
         self,
@@ -86,19 +246,9 @@ class HubSpotClient:
         Returns:
             Dict with 'results' and 'paging' keys
         """
-        default_properties = [
-            "subject",
-            "content",
-            "hs_ticket_id",
-            "hs_ticket_priority",
-            "hs_pipeline_stage",
-            "createdate",
-            "hs_lastmodifieddate",
-        ]
-
         request_body = {
             "limit": min(limit, 100),
-            "properties": properties or default_properties,
+            "properties": properties or self.DEFAULT_TICKET_PROPERTIES,
             "sorts": [
                 {
                     "propertyName": sort_by,
@@ -107,15 +257,12 @@ class HubSpotClient:
             ]
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.BASE_URL}/crm/v3/objects/tickets/search",
-                headers=self.headers,
-                json=request_body,
-                timeout=30.0
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._client.post(
+            "/crm/v3/objects/tickets/search",
+            json=request_body,
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
     async def get_tickets(
         self,
@@ -137,72 +284,77 @@ class HubSpotClient:
         Returns:
             Dict with 'results' and 'paging' keys
         """
-        default_properties = [
-            "subject",
-            "content",
-            "hs_ticket_id",
-            "hs_ticket_priority",
-            "hs_pipeline_stage",
-            "createdate",
-            "hs_lastmodifieddate",
-        ]
-
         params = {
             "limit": min(limit, 100),
-            "properties": properties or default_properties,
+            "properties": properties or self.DEFAULT_TICKET_PROPERTIES,
+            # Skip server-side archived filtering work
+            "archived": "false",
         }
 
         if after:
             params["after"] = after
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.BASE_URL}/crm/v3/objects/tickets",
-                headers=self.headers,
-                params=params,
-                timeout=30.0
+        return await self._get_with_etag("/crm/v3/objects/tickets", params=params)
+
+    async def iter_tickets(
+        self,
+        page_size: int = 100,
+        properties: List[str] | None = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over all tickets, transparently following pagination.
+
+        Prefetches the next page while the caller processes the current
+        one, so multi-page crawls overlap network time with ticket
+        processing instead of paying a full round-trip per page.
+
+        Args:
+            page_size: Tickets per page (max 100)
+            properties: List of properties to fetch
+
+        Yields:
+            Ticket dicts, one at a time, in API order
+        """
+        page = await self.get_tickets(limit=page_size, properties=properties)
+        while True:
+            after = page.get("paging", {}).get("next", {}).get("after")
+            next_task = (
+                asyncio.create_task(
+                    self.get_tickets(limit=page_size, after=after, properties=properties)
+                )
+                if after
+                else None
             )
-            response.raise_for_status()
-            return response.json()
+            try:
+                for ticket in page.get("results", []):
+                    yield ticket
+                if next_task is None:
+                    return
+                page = await next_task
+                next_task = None
+            finally:
+                # Caller abandoned the generator mid-page: don't leak the
+                # in-flight prefetch
+                if next_task is not None:
+                    next_task.cancel()
 
     async def get_ticket(self, ticket_id: str) -> Dict[str, Any]:
         """Fetch a single ticket by ID."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.BASE_URL}/crm/v3/objects/tickets/{ticket_id}",
-                headers=self.headers,
-                timeout=30.0
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._client.get(f"/crm/v3/objects/tickets/{ticket_id}")
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
     async def get_companies(self, limit: int = 100) -> Dict[str, Any]:
         """Fetch companies from HubSpot."""
         params = {"limit": min(limit, 100)}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.BASE_URL}/crm/v3/objects/companies",
-                headers=self.headers,
-                params=params,
-                timeout=30.0
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._get_with_etag("/crm/v3/objects/companies", params=params)
 
     async def get_contacts(self, limit: int = 100) -> Dict[str, Any]:
         """Fetch contacts from HubSpot."""
         params = {"limit": min(limit, 100)}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.BASE_URL}/crm/v3/objects/contacts",
-                headers=self.headers,
-                params=params,
-                timeout=30.0
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._get_with_etag("/crm/v3/objects/contacts", params=params)
 
     async def get_ticket_associations(
         self,
@@ -219,14 +371,11 @@ class HubSpotClient:
         Returns:
             Dict with 'results' containing association IDs
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.BASE_URL}/crm/v4/objects/tickets/{ticket_id}/associations/{association_type}",
-                headers=self.headers,
-                timeout=30.0
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._client.get(
+            f"/crm/v4/objects/tickets/{ticket_id}/associations/{association_type}"
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
     async def get_email(self, email_id: str) -> Dict[str, Any]:
         """
@@ -238,25 +387,32 @@ class HubSpotClient:
         Returns:
             Dict with email properties including subject, text, html, etc.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.BASE_URL}/crm/v3/objects/emails/{email_id}",
-                headers=self.headers,
-                params={
-                    "properties": [
-                        "hs_email_subject",
-                        "hs_email_text",
-                        "hs_email_html",
-                        "hs_timestamp",
-                        "hs_email_direction",
-                        "hs_email_from",
-                        "hs_email_to"
-                    ]
-                },
-                timeout=30.0
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._client.get(
+            f"/crm/v3/objects/emails/{email_id}",
+            params={"properties": self.EMAIL_PROPERTIES},
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def batch_read_emails(self, email_ids: List[str]) -> Dict[str, Any]:
+        """
+        Fetch up to BATCH_READ_LIMIT email engagements in one request.
+
+        Args:
+            email_ids: HubSpot email engagement IDs (max 100)
+
+        Returns:
+            Dict with 'results' containing the email objects
+        """
+        response = await self._client.post(
+            "/crm/v3/objects/emails/batch/read",
+            json={
+                "inputs": [{"id": str(email_id)} for email_id in email_ids],
+                "properties": self.EMAIL_PROPERTIES,
+            },
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
     async def get_ticket_email_thread(self, ticket_id: str) -> List[Dict[str, Any]]:
         """
@@ -288,25 +444,32 @@ class HubSpotClient:
         if not email_ids:
             return []
 
-        # Fetch each email's details
+        # Batch-read the emails: one POST per 100 ids instead of one GET
+        # per email. Batches still run concurrently for long threads.
+        batches = [
+            email_ids[i:i + self.BATCH_READ_LIMIT]
+            for i in range(0, len(email_ids), self.BATCH_READ_LIMIT)
+        ]
+        results = await asyncio.gather(
+            *(self.batch_read_emails(batch) for batch in batches),
+            return_exceptions=True,
+        )
+
         emails = []
-        for email_id in email_ids:
-            try:
-                email_data = await self.get_email(email_id)
-                emails.append(email_data)
-            except httpx.HTTPStatusError as e:
-                # Log but continue if individual email fetch fails
+        for batch, result in zip(batches, results):
+            if isinstance(result, BaseException):
                 import logging
                 logger = logging.getLogger(__name__)
-                logger.warning(f"Failed to fetch email {email_id}: {e}")
+                logger.warning(f"Failed to fetch emails {batch}: {result}")
                 continue
+            emails.extend(result.get("results", []))
 
-        # Sort by timestamp (oldest first for chronological thread)
-        emails.sort(
-            key=lambda e: e.get("properties", {}).get("hs_timestamp", "0")
-        )
-
-        return emails
+        # Sort by timestamp (oldest first for chronological thread).
+        # Decorate-sort-undecorate: parse each timestamp to an int once
+        # instead of walking dicts and comparing strings per comparison.
+        annotated = [(_email_sort_ts(email), email) for email in emails]
+        annotated.sort(key=itemgetter(0))
+        return [email for _, email in annotated]
 
     async def create_webhook_subscription(
         self,
@@ -320,19 +483,16 @@ class HubSpotClient:
             webhook_url: URL to receive webhook events
             subscription_type: Type of event (e.g., "ticket.creation", "ticket.propertyChange")
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.BASE_URL}/webhooks/v3/{settings.HUBSPOT_CLIENT_ID}/subscriptions",
-                headers=self.headers,
-                json={
-                    "enabled": True,
-                    "subscriptionDetails": {
-                        "subscriptionType": subscription_type,
-                        "propertyName": None,
-                    },
-                    "webhookUrl": webhook_url,
+        response = await self._client.post(
+            f"/webhooks/v3/{settings.HUBSPOT_CLIENT_ID}/subscriptions",
+            json={
+                "enabled": True,
+                "subscriptionDetails": {
+                    "subscriptionType": subscription_type,
+                    "propertyName": None,
                 },
-                timeout=30.0
-            )
-            response.raise_for_status()
-            return response.json()
+                "webhookUrl": webhook_url,
+            },
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
@@ -1,21 +1,35 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from src.core.config import settings
 from src.api.dependencies import get_current_user
 from src.api.routers import integrations, auth, tickets
+from src.integrations.hubspot import close_oauth_client
 from src.models.user import User
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Drain pooled outbound connections on shutdown
+    await close_oauth_client()
+
+
 app = FastAPI(
     title="Churn Risk API",
     version="0.1.0",
     docs_url=f"{settings.API_V1_PREFIX}/docs",
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.get_cors_origins_list(),
+    allow_origins=settings.cors_origins_list,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
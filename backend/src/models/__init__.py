@@ -1,28 +1,20 @@
-"""Models package - exports all database models and enums."""
+"""Models package - exports all database models and enums.
 
-# Base models and mixins
-from src.models.base import Base, TimestampMixin, UUIDMixin
+Every model module is imported eagerly on purpose: relationships are
+declared by string name ("ChurnRiskCard", "Contact", ...), and SQLAlchemy
+can only resolve those once the defining module has run and registered
+its mappers. Lazy re-exports here break mapper configuration for any
+import path that doesn't happen to touch every module.
+"""
 
-# Tenant model
+from src.models.base import Base, TimestampMixin, UUIDMixin
 from src.models.tenant import Tenant, PlanTier
-
-# User model
 from src.models.user import User, UserRole
-
-# Integration models
 from src.models.integration import Integration, IntegrationType, IntegrationStatus
-
-# Company and Contact models
 from src.models.company import Company
 from src.models.contact import Contact
-
-# Ticket models
 from src.models.ticket import Ticket, TicketStatus, SentimentScore
-
-# Topic models
 from src.models.topic import TicketTopic, TicketTopicAssignment, AssignedBy
-
-# Churn risk models
 from src.models.churn_risk import (
     ChurnRiskCard,
     ChurnRiskComment,
@@ -31,32 +23,24 @@ from src.models.churn_risk import (
 )
 
 __all__ = [
-    # Base
     "Base",
     "TimestampMixin",
     "UUIDMixin",
-    # Tenant
     "Tenant",
     "PlanTier",
-    # User
     "User",
     "UserRole",
-    # Integration
     "Integration",
     "IntegrationType",
     "IntegrationStatus",
-    # Company and Contact
     "Company",
     "Contact",
-    # Ticket
     "Ticket",
     "TicketStatus",
     "SentimentScore",
-    # Topic
     "TicketTopic",
     "TicketTopicAssignment",
     "AssignedBy",
-    # Churn Risk
     "ChurnRiskCard",
     "ChurnRiskComment",
     "ChurnRiskStatus",
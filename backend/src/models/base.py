@@ -1,3 +1,5 @@
+import os
+import time
 import uuid
 from datetime import datetime, timezone
 from sqlalchemy import Column, DateTime
@@ -5,6 +7,24 @@ from sqlalchemy.dialects.postgresql import UUID
 from src.core.database import Base
 
 
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUIDv7 (RFC 9562).
+
+    Random v4 keys land on random B-tree leaf pages; the 48-bit
+    millisecond prefix here keeps new rows clustered at the right edge
+    of the primary key index, which matters on high-insert tables like
+    tickets and churn risk cards. Same column type as v4 — no migration.
+    """
+    ts_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (ts_ms & 0xFFFFFFFFFFFF) << 80
+    value |= 0x7 << 76  # version 7
+    value |= ((rand >> 62) & 0xFFF) << 64
+    value |= 0x2 << 62  # RFC variant
+    value |= rand & 0x3FFFFFFFFFFFFFFF
+    return uuid.UUID(int=value)
+
+
 class TimestampMixin:
     """Mixin for created_at and updated_at timestamps."""
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
@@ -13,4 +33,4 @@ class TimestampMixin:
 
 class UUIDMixin:
     """Mixin for UUID primary key."""
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
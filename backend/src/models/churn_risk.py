@@ -1,5 +1,5 @@
-from sqlalchemy import Column, String, ForeignKey, Enum as SQLEnum, DateTime, Text, Index
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, ForeignKey, Enum as SQLEnum, DateTime, Text, Index, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.types import JSON
 from sqlalchemy.orm import relationship
 import enum
@@ -21,20 +21,41 @@ class ChurnRiskStatus(str, enum.Enum):
     COMPLETED = "completed"
 
 
+# Store enum values (not Python names) so Postgres hands back plain strings
+# and row loading skips name-based coercion on large card lists
+_enum_values = lambda e: [m.value for m in e]  # noqa: E731
+
+
 class ChurnRiskCard(Base, UUIDMixin, TimestampMixin):
     """Churn risk card model - Kanban cards for at-risk customers."""
     __tablename__ = "churn_risk_cards"
     __table_args__ = (
-        Index("ix_churn_risks_tenant_status", "tenant_id", "status", "created_at"),
+        # Board query shape: filter tenant+status, newest first; INCLUDE
+        # carries the card fields the Kanban view renders so Postgres can
+        # answer with index-only scans
+        Index(
+            "ix_churn_risks_board",
+            "tenant_id",
+            "status",
+            text("created_at DESC"),
+            postgresql_include=["owner_id", "trigger_type", "company_id"],
+        ),
+        # "My open cards": partial index over everything not completed
+        Index(
+            "ix_churn_risks_owner_open",
+            "tenant_id",
+            "owner_id",
+            postgresql_where=text("status <> 'completed'"),
+        ),
     )
 
     tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True)
-    trigger_type = Column(SQLEnum(TriggerType), nullable=False)
+    trigger_type = Column(SQLEnum(TriggerType, values_callable=_enum_values), nullable=False)
     company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id", ondelete="CASCADE"), nullable=False, index=True)
     contact_id = Column(UUID(as_uuid=True), ForeignKey("contacts.id", ondelete="SET NULL"), nullable=True)
     ticket_id = Column(UUID(as_uuid=True), ForeignKey("tickets.id", ondelete="SET NULL"), nullable=True)  # Triggering ticket
 
-    status = Column(SQLEnum(ChurnRiskStatus), default=ChurnRiskStatus.NEW, nullable=False)
+    status = Column(SQLEnum(ChurnRiskStatus, values_callable=_enum_values), default=ChurnRiskStatus.NEW, nullable=False)
     owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     completed_at = Column(DateTime, nullable=True)
 
@@ -44,7 +65,7 @@ class ChurnRiskCard(Base, UUIDMixin, TimestampMixin):
     contact = relationship("Contact", back_populates="churn_risks")
     ticket = relationship("Ticket", back_populates="churn_risk")
     owner = relationship("User", foreign_keys=[owner_id], back_populates="owned_churn_risks")
-    comments = relationship("ChurnRiskComment", back_populates="card", cascade="all, delete-orphan")
+    comments = relationship("ChurnRiskComment", back_populates="card", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f"<ChurnRiskCard {self.trigger_type} for company {self.company_id}>"
@@ -53,12 +74,25 @@ class ChurnRiskCard(Base, UUIDMixin, TimestampMixin):
 class ChurnRiskComment(Base, UUIDMixin, TimestampMixin):
     """Comment on a churn risk card."""
     __tablename__ = "churn_risk_comments"
+    __table_args__ = (
+        # jsonb_path_ops GIN: containment-only, smaller and faster than the
+        # default jsonb opclass for the mentions @> probe
+        Index(
+            "ix_comments_mentions",
+            "mentions",
+            postgresql_using="gin",
+            postgresql_ops={"mentions": "jsonb_path_ops"},
+        ),
+    )
 
     tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True)
     card_id = Column(UUID(as_uuid=True), ForeignKey("churn_risk_cards.id", ondelete="CASCADE"), nullable=False, index=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     content = Column(Text, nullable=False)
-    mentions = Column(JSON, default=list)  # User IDs tagged as JSON array, uses ARRAY on PostgreSQL, TEXT on SQLite
+    # User IDs tagged, stored as a JSON array of uuid strings. jsonb on
+    # Postgres so "comments mentioning me" runs as a @> containment probe
+    # against the GIN index below; plain JSON elsewhere (SQLite tests)
+    mentions = Column(JSON().with_variant(JSONB, "postgresql"), default=list)
 
     # Relationships
     tenant = relationship("Tenant")
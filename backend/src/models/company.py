@@ -1,5 +1,5 @@
 from sqlalchemy import Column, String, ForeignKey, Numeric, Index
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.types import JSON
 from sqlalchemy.orm import relationship
 from src.models.base import Base, UUIDMixin, TimestampMixin
@@ -10,17 +10,26 @@ class Company(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "companies"
     __table_args__ = (
         Index("ix_companies_tenant_external", "tenant_id", "external_id"),
+        # Containment filters on custom CRM fields; only @> / @? / @@ use
+        # this index, so write filters as
+        # Company.crm_metadata.op('@>')({"industry": "SaaS"})
+        Index(
+            "ix_companies_crm_metadata_gin",
+            "crm_metadata",
+            postgresql_using="gin",
+            postgresql_ops={"crm_metadata": "jsonb_path_ops"},
+        ),
     )
 
     tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True)
     external_id = Column(String(255), nullable=False)  # HubSpot company ID
     name = Column(String(255), nullable=False)
     mrr = Column(Numeric(10, 2), nullable=True)  # Monthly recurring revenue
-    crm_metadata = Column(JSON, default=dict)  # Custom fields from CRM, uses JSONB on PostgreSQL, TEXT on SQLite
+    crm_metadata = Column(JSON().with_variant(JSONB, "postgresql"), default=dict)  # Custom fields from CRM; JSONB on PostgreSQL, TEXT on SQLite
 
     # Relationships
     tenant = relationship("Tenant", back_populates="companies")
-    contacts = relationship("Contact", back_populates="company", cascade="all, delete-orphan")
+    contacts = relationship("Contact", back_populates="company", cascade="all, delete-orphan", passive_deletes=True)
     tickets = relationship("Ticket", back_populates="company")
     churn_risks = relationship("ChurnRiskCard", back_populates="company")
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, Enum as SQLEnum, DateTime, Text
+from sqlalchemy import Column, ForeignKey, Enum as SQLEnum, DateTime, Index, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.types import JSON
 from sqlalchemy.orm import relationship
@@ -23,6 +23,10 @@ class IntegrationStatus(str, enum.Enum):
 class Integration(Base, UUIDMixin, TimestampMixin):
     """Integration model - HubSpot/Zendesk connections."""
     __tablename__ = "integrations"
+    __table_args__ = (
+        # OAuth callback and sync paths look up by (tenant, type)
+        Index("ix_integrations_tenant_type", "tenant_id", "type"),
+    )
 
     tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True)
     type = Column(SQLEnum(IntegrationType), nullable=False)
@@ -20,12 +20,12 @@ class Tenant(Base, UUIDMixin, TimestampMixin):
     plan_tier = Column(SQLEnum(PlanTier), default=PlanTier.STARTER, nullable=False)
 
     # Relationships
-    users = relationship("User", back_populates="tenant", cascade="all, delete-orphan")
-    integrations = relationship("Integration", back_populates="tenant", cascade="all, delete-orphan")
-    companies = relationship("Company", back_populates="tenant", cascade="all, delete-orphan")
-    tickets = relationship("Ticket", back_populates="tenant", cascade="all, delete-orphan")
-    topics = relationship("TicketTopic", back_populates="tenant", cascade="all, delete-orphan")
-    churn_risks = relationship("ChurnRiskCard", back_populates="tenant", cascade="all, delete-orphan")
+    users = relationship("User", back_populates="tenant", cascade="all, delete-orphan", passive_deletes=True)
+    integrations = relationship("Integration", back_populates="tenant", cascade="all, delete-orphan", passive_deletes=True)
+    companies = relationship("Company", back_populates="tenant", cascade="all, delete-orphan", passive_deletes=True)
+    tickets = relationship("Ticket", back_populates="tenant", cascade="all, delete-orphan", passive_deletes=True)
+    topics = relationship("TicketTopic", back_populates="tenant", cascade="all, delete-orphan", passive_deletes=True)
+    churn_risks = relationship("ChurnRiskCard", back_populates="tenant", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f"<Tenant {self.name} ({self.subdomain})>"
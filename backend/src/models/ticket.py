@@ -1,5 +1,5 @@
-from sqlalchemy import Column, String, ForeignKey, Text, Enum as SQLEnum, Float, DateTime, Index
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, ForeignKey, Text, Enum as SQLEnum, Float, DateTime, Index, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.types import JSON
 from sqlalchemy.orm import relationship
 import enum
@@ -29,6 +29,35 @@ class Ticket(Base, UUIDMixin, TimestampMixin):
     __table_args__ = (
         Index("ix_tickets_tenant_external", "tenant_id", "external_id", unique=True),
         Index("ix_tickets_tenant_sentiment", "tenant_id", "sentiment_score", "created_at"),
+        # list_tickets paginates newest-first per tenant; INCLUDE carries
+        # the columns the list view renders so summary-style queries can be
+        # answered index-only without heap fetches
+        Index(
+            "ix_tickets_tenant_created_desc",
+            "tenant_id",
+            text("created_at DESC"),
+            postgresql_include=["subject", "sentiment_score", "priority", "company_id"],
+        ),
+        # Dashboard hot path: "negative tickets, newest first, per tenant".
+        # Partial index covers only at-risk rows, so it stays small enough
+        # to live in cache. Predicate uses the stored enum labels (member
+        # names) from the initial schema.
+        Index(
+            "ix_tickets_negative_sentiment",
+            "tenant_id",
+            text("created_at DESC"),
+            postgresql_where=text("sentiment_score IN ('NEGATIVE', 'VERY_NEGATIVE')"),
+        ),
+        # Containment filters on raw HubSpot fields. Only @> / @? / @@ hit
+        # this index - write filters as
+        # Ticket.source_metadata.op('@>')({"key": value}), not
+        # source_metadata['key'].astext == value
+        Index(
+            "ix_tickets_source_metadata_gin",
+            "source_metadata",
+            postgresql_using="gin",
+            postgresql_ops={"source_metadata": "jsonb_path_ops"},
+        ),
     )
 
     tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -51,13 +80,13 @@ class Ticket(Base, UUIDMixin, TimestampMixin):
     sentiment_analyzed_at = Column(DateTime, nullable=True)
 
     external_url = Column(String(500), nullable=True)  # Deep link to HubSpot
-    source_metadata = Column(JSON, default=dict)  # Raw data from source, uses JSONB on PostgreSQL, TEXT on SQLite
+    source_metadata = Column(JSON().with_variant(JSONB, "postgresql"), default=dict)  # Raw data from source; JSONB on PostgreSQL, TEXT on SQLite
 
     # Relationships
     tenant = relationship("Tenant", back_populates="tickets")
     company = relationship("Company", back_populates="tickets")
     contact = relationship("Contact", back_populates="tickets")
-    topic_assignments = relationship("TicketTopicAssignment", back_populates="ticket", cascade="all, delete-orphan")
+    topic_assignments = relationship("TicketTopicAssignment", back_populates="ticket", cascade="all, delete-orphan", passive_deletes=True)
     churn_risk = relationship("ChurnRiskCard", back_populates="ticket", uselist=False)
 
     def __repr__(self):
@@ -20,7 +20,7 @@ class TicketTopic(Base, UUIDMixin, TimestampMixin):
 
     # Relationships
     tenant = relationship("Tenant", back_populates="topics")
-    ticket_assignments = relationship("TicketTopicAssignment", back_populates="topic", cascade="all, delete-orphan")
+    ticket_assignments = relationship("TicketTopicAssignment", back_populates="topic", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f"<TicketTopic {self.name}>"
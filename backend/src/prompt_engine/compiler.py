@@ -3,12 +3,25 @@ Prompt Compiler - Compiles prompts by substituting variables.
 """
 
 import re
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List
 
 
 class PromptCompiler:
     """Compiles prompts by replacing {{variables}} with values."""
 
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _pattern_for(names: FrozenSet[str]) -> re.Pattern:
+        """One alternation pattern per variable set, compiled once.
+
+        The same templates are compiled with the same variable names on
+        every analysis call, so the lru_cache makes repeat compilations
+        free.
+        """
+        alternation = '|'.join(re.escape(name) for name in sorted(names))
+        return re.compile(r'\{\{\s*(' + alternation + r')\s*\}\}')
+
     @staticmethod
     def compile(
         template: str,
@@ -39,16 +52,18 @@ class PromptCompiler:
             if var_def['name'] not in variables and 'default' in var_def:
                 variables[var_def['name']] = var_def['default']
 
-        # Replace variables
-        result = template
-        for name, value in variables.items():
-            # Match {{variable_name}} with optional whitespace
-            pattern = r'\{\{\s*' + re.escape(name) + r'\s*\}\}'
-            # Convert value to string, handle None as empty string
-            replacement = str(value) if value is not None else ''
-            result = re.sub(pattern, replacement, result)
-
-        return result
+        # Replace all variables in a single pass: one alternation pattern
+        # instead of one full scan of the template per variable
+        if not variables:
+            return template
+
+        # Convert values to strings, handle None as empty string
+        replacements = {
+            name: str(value) if value is not None else ''
+            for name, value in variables.items()
+        }
+        pattern = PromptCompiler._pattern_for(frozenset(replacements))
+        return pattern.sub(lambda m: replacements[m.group(1)], template)
 
     @staticmethod
     def validate_variables(
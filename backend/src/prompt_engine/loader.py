@@ -2,11 +2,15 @@
 Prompt Loader - Loads prompts from Markdown files with YAML frontmatter.
 """
 
-import re
+import copy
 from pathlib import Path
 from typing import Any, Dict, List
 import yaml
 
+# libyaml's C parser is a drop-in, much faster SafeLoader; fall back to the
+# pure-Python loader where PyYAML was built without it
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class PromptLoader:
     """Loads prompts from Markdown files with YAML frontmatter."""
@@ -19,6 +23,10 @@ class PromptLoader:
             prompts_dir: Path to the prompts directory (relative to project root)
         """
         self.prompts_dir = Path(prompts_dir)
+        # path -> (mtime_ns, parsed result). Hot prompts are loaded per
+        # ticket; the stat call is the only syscall on a cache hit and an
+        # mtime change invalidates automatically on deploys/edits
+        self._cache: Dict[Path, tuple] = {}
 
     def load(self, prompt_path: str) -> Dict[str, Any]:
         """
@@ -44,30 +52,43 @@ class PromptLoader:
 
         full_path = self.prompts_dir / prompt_path
 
-        if not full_path.exists():
+        try:
+            mtime = full_path.stat().st_mtime_ns
+        except FileNotFoundError:
             raise FileNotFoundError(f"Prompt file not found: {full_path}")
 
+        cached = self._cache.get(full_path)
+        if cached is not None and cached[0] == mtime:
+            # Deep copy so callers can mutate their result safely
+            return copy.deepcopy(cached[1])
+
         content = full_path.read_text()
 
-        # Parse frontmatter using regex
-        match = re.match(r'^---\s*\n(.*?)\n---\s*\n(.*)$', content, re.DOTALL)
-        if not match:
+        # Split frontmatter with C-level str.find instead of a DOTALL regex
+        # over the whole body
+        if not content.startswith('---'):
+            raise ValueError(f"No frontmatter found in {prompt_path}")
+        end = content.find('\n---', 3)
+        if end == -1:
             raise ValueError(f"No frontmatter found in {prompt_path}")
 
-        frontmatter = match.group(1)
-        markdown = match.group(2).strip()
+        frontmatter = content[3:end].strip('\n')
+        newline = content.find('\n', end + 1)
+        markdown = content[newline + 1:].strip() if newline != -1 else ''
 
         # Parse YAML frontmatter
         try:
-            metadata = yaml.safe_load(frontmatter)
+            metadata = yaml.load(frontmatter, Loader=_YamlLoader)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in frontmatter of {prompt_path}: {e}") from e
 
-        return {
+        result = {
             'metadata': metadata,
             'content': markdown,
             'variables': metadata.get('variables', [])
         }
+        self._cache[full_path] = (mtime, result)
+        return copy.deepcopy(result)
 
     def list_prompts(self, pattern: str = "**/*.md") -> List[Path]:
         """
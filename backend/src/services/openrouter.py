@@ -1,5 +1,5 @@
 import httpx
-import json
+import orjson
 from pathlib import Path
 from typing import List
 from tenacity import retry, stop_after_attempt, wait_exponential
@@ -29,6 +29,11 @@ class OpenRouterAnalyzer(TicketAnalyzer):
         self.prompt_loader = PromptLoader(str(prompts_dir))
         self.prompt_compiler = PromptCompiler()
 
+        # Load the analysis prompts once at construction; per-call work is
+        # then just variable substitution into the cached templates
+        self._system_prompt_data = self.prompt_loader.load('analysis/ticket-analysis.system')
+        self._user_prompt_data = self.prompt_loader.load('analysis/ticket-analysis.user')
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10)
@@ -44,9 +49,9 @@ class OpenRouterAnalyzer(TicketAnalyzer):
 
         Performs both sentiment analysis and topic classification in a single call.
         """
-        # Load prompts from files
-        system_prompt_data = self.prompt_loader.load('analysis/ticket-analysis.system')
-        user_prompt_data = self.prompt_loader.load('analysis/ticket-analysis.user')
+        # Prompts were loaded once in __init__
+        system_prompt_data = self._system_prompt_data
+        user_prompt_data = self._user_prompt_data
 
         # Build the user prompt with variable substitution
         user_prompt = self._build_analysis_prompt_from_template(
@@ -87,7 +92,7 @@ class OpenRouterAnalyzer(TicketAnalyzer):
             )
             response.raise_for_status()
 
-            result = response.json()
+            result = orjson.loads(response.content)
 
             # Debug logging (can be removed in production)
             if not result.get("choices"):
@@ -112,8 +117,8 @@ class OpenRouterAnalyzer(TicketAnalyzer):
                 content = "\n".join(lines).strip()
 
             try:
-                parsed = json.loads(content)
-            except json.JSONDecodeError as e:
+                parsed = orjson.loads(content)
+            except orjson.JSONDecodeError as e:
                 raise ValueError(f"Failed to parse LLM response as JSON. Content was: '{content[:200]}...'. Error: {e}") from e
 
             return self._parse_analysis_result(parsed)
@@ -165,7 +170,7 @@ User Training Rules (apply these when classifying):
         # Compile the prompt with all variables
         variables = {
             'ticket_content': ticket_content,
-            'has_topics': available_topics is not None,
+            'has_topics': bool(available_topics),
             'topics_section': topics_section,
             'training_rules_section': training_rules_section,
             'json_schema': json_schema
@@ -1,7 +1,7 @@
 """Ticket import service for fetching and analyzing HubSpot tickets."""
 
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from typing import Dict, Any
 from uuid import UUID
 from pydantic import BaseModel
@@ -10,8 +10,11 @@ from sqlalchemy import select
 
 from src.models.ticket import Ticket, TicketStatus
 from src.models.integration import Integration, IntegrationType, IntegrationStatus
-from src.models.company import Company
-from src.models.contact import Contact
+# Imported for their side effect: registering the Company/Contact mappers
+# that Ticket's string-named relationships resolve against. Ruff can't see
+# that, hence the noqa.
+from src.models.company import Company  # noqa: F401
+from src.models.contact import Contact  # noqa: F401
 from src.integrations.hubspot import HubSpotClient
 from src.services.openrouter import OpenRouterAnalyzer
 
@@ -77,26 +80,27 @@ class TicketImportService:
         if not access_token:
             raise ValueError("HubSpot access token not found in integration credentials")
 
-        client = HubSpotClient(access_token)
-
-        # 3. Fetch tickets from last N days
-        logger.info(f"Fetching tickets for tenant {tenant_id}, {days_back} days back...")
-        try:
-            tickets_data = await self._fetch_recent_tickets(client, integration, days_back)
-        except Exception as e:
-            logger.error(f"Failed to fetch tickets from HubSpot: {e}")
-            raise
-
-        logger.info(f"Fetched {len(tickets_data)} tickets from HubSpot for tenant {tenant_id}")
-
-        # 4. Process each ticket
-        for i, ticket_data in enumerate(tickets_data, 1):
+        # async with closes the client's connection pool when the import
+        # finishes instead of leaking it until garbage collection
+        async with HubSpotClient(access_token) as client:
+            # 3. Fetch tickets from last N days
+            logger.info(f"Fetching tickets for tenant {tenant_id}, {days_back} days back...")
             try:
-                logger.info(f"[Ticket Import] Processing ticket {i}/{len(tickets_data)}: {ticket_data.get('id')}")
-                await self._process_ticket(tenant_id, ticket_data, result, integration, client)
+                tickets_data = await self._fetch_recent_tickets(client, integration, days_back)
             except Exception as e:
-                logger.error(f"[Ticket Import] Failed to process ticket {ticket_data.get('id')}: {e}", exc_info=True)
-                result.failed += 1
+                logger.error(f"Failed to fetch tickets from HubSpot: {e}")
+                raise
+
+            logger.info(f"Fetched {len(tickets_data)} tickets from HubSpot for tenant {tenant_id}")
+
+            # 4. Process each ticket
+            for i, ticket_data in enumerate(tickets_data, 1):
+                try:
+                    logger.info(f"[Ticket Import] Processing ticket {i}/{len(tickets_data)}: {ticket_data.get('id')}")
+                    await self._process_ticket(tenant_id, ticket_data, result, integration, client)
+                except Exception as e:
+                    logger.error(f"[Ticket Import] Failed to process ticket {ticket_data.get('id')}: {e}", exc_info=True)
+                    result.failed += 1
 
         # 5. Commit all changes
         logger.info(f"[Ticket Import] Committing {result.imported} imported, {result.analyzed} analyzed tickets...")
@@ -158,8 +162,11 @@ class TicketImportService:
                 if not refresh_token:
                     raise ValueError("No refresh token available")
 
-                # Refresh the token
-                new_tokens = await HSClient.refresh_access_token(refresh_token)
+                # Refresh through the shared token cache; force_refresh
+                # because HubSpot just rejected the token we sent
+                new_tokens = await HSClient.get_valid_access_token(
+                    refresh_token, force_refresh=True
+                )
 
                 # Update integration credentials
                 integration.credentials = new_tokens
@@ -168,8 +175,9 @@ class TicketImportService:
 
                 logger.info("Token refreshed successfully")
 
-                # Create new client with fresh token and retry
-                client = HubSpotClient(access_token=new_tokens["access_token"])
+                # Swap the token on the existing client (keeps its pooled
+                # connections, and avoids leaking the old pool) and retry
+                client.set_access_token(new_tokens["access_token"])
                 response = await client.search_tickets(
                     limit=20,
                     sort_by="createdate",
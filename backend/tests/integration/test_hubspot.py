@@ -1,5 +1,7 @@
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
+
+import orjson
 from src.integrations.hubspot import HubSpotClient
 
 
@@ -13,11 +15,11 @@ async def test_exchange_code_for_token():
     }
 
     mock_resp = MagicMock()
-    mock_resp.json = MagicMock(return_value=mock_response)
+    mock_resp.content = orjson.dumps(mock_response)
     mock_resp.raise_for_status = MagicMock()
 
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_client.return_value.__aenter__.return_value.post = AsyncMock(return_value=mock_resp)
+    with patch("src.integrations.hubspot._get_oauth_client") as mock_client:
+        mock_client.return_value.post = AsyncMock(return_value=mock_resp)
 
         result = await HubSpotClient.exchange_code_for_token(
             code="test-code",
@@ -39,11 +41,11 @@ async def test_refresh_access_token():
     }
 
     mock_resp = MagicMock()
-    mock_resp.json = MagicMock(return_value=mock_response)
+    mock_resp.content = orjson.dumps(mock_response)
     mock_resp.raise_for_status = MagicMock()
 
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_client.return_value.__aenter__.return_value.post = AsyncMock(return_value=mock_resp)
+    with patch("src.integrations.hubspot._get_oauth_client") as mock_client:
+        mock_client.return_value.post = AsyncMock(return_value=mock_resp)
 
         result = await HubSpotClient.refresh_access_token(
             refresh_token="old-refresh-token"
@@ -85,18 +87,17 @@ async def test_get_tickets():
     }
 
     mock_resp = MagicMock()
-    mock_resp.json = MagicMock(return_value=mock_response)
+    mock_resp.content = orjson.dumps(mock_response)
     mock_resp.raise_for_status = MagicMock()
 
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_resp)
+    client._client.get = AsyncMock(return_value=mock_resp)
 
-        result = await client.get_tickets(limit=10)
+    result = await client.get_tickets(limit=10)
 
-        assert len(result["results"]) == 2
-        assert result["results"][0]["id"] == "123"
-        assert result["results"][0]["properties"]["subject"] == "Test ticket"
-        assert result["results"][1]["id"] == "456"
+    assert len(result["results"]) == 2
+    assert result["results"][0]["id"] == "123"
+    assert result["results"][0]["properties"]["subject"] == "Test ticket"
+    assert result["results"][1]["id"] == "456"
 
 
 @pytest.mark.asyncio
@@ -114,16 +115,15 @@ async def test_get_ticket():
     }
 
     mock_resp = MagicMock()
-    mock_resp.json = MagicMock(return_value=mock_response)
+    mock_resp.content = orjson.dumps(mock_response)
     mock_resp.raise_for_status = MagicMock()
 
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_resp)
+    client._client.get = AsyncMock(return_value=mock_resp)
 
-        result = await client.get_ticket(ticket_id="123")
+    result = await client.get_ticket(ticket_id="123")
 
-        assert result["id"] == "123"
-        assert result["properties"]["subject"] == "Test ticket"
+    assert result["id"] == "123"
+    assert result["properties"]["subject"] == "Test ticket"
 
 
 @pytest.mark.asyncio
@@ -152,17 +152,16 @@ async def test_get_companies():
     }
 
     mock_resp = MagicMock()
-    mock_resp.json = MagicMock(return_value=mock_response)
+    mock_resp.content = orjson.dumps(mock_response)
     mock_resp.raise_for_status = MagicMock()
 
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_resp)
+    client._client.get = AsyncMock(return_value=mock_resp)
 
-        result = await client.get_companies(limit=50)
+    result = await client.get_companies(limit=50)
 
-        assert len(result["results"]) == 2
-        assert result["results"][0]["properties"]["name"] == "Acme Corp"
-        assert result["results"][1]["properties"]["name"] == "Widget Inc"
+    assert len(result["results"]) == 2
+    assert result["results"][0]["properties"]["name"] == "Acme Corp"
+    assert result["results"][1]["properties"]["name"] == "Widget Inc"
 
 
 @pytest.mark.asyncio
@@ -193,17 +192,16 @@ async def test_get_contacts():
     }
 
     mock_resp = MagicMock()
-    mock_resp.json = MagicMock(return_value=mock_response)
+    mock_resp.content = orjson.dumps(mock_response)
     mock_resp.raise_for_status = MagicMock()
 
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_resp)
+    client._client.get = AsyncMock(return_value=mock_resp)
 
-        result = await client.get_contacts(limit=50)
+    result = await client.get_contacts(limit=50)
 
-        assert len(result["results"]) == 2
-        assert result["results"][0]["properties"]["email"] == "john@acme.com"
-        assert result["results"][1]["properties"]["email"] == "jane@widget.com"
+    assert len(result["results"]) == 2
+    assert result["results"][0]["properties"]["email"] == "john@acme.com"
+    assert result["results"][1]["properties"]["email"] == "jane@widget.com"
 
 
 @pytest.mark.asyncio
@@ -219,20 +217,19 @@ async def test_create_webhook_subscription():
     }
 
     mock_resp = MagicMock()
-    mock_resp.json = MagicMock(return_value=mock_response)
+    mock_resp.content = orjson.dumps(mock_response)
     mock_resp.raise_for_status = MagicMock()
 
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_client.return_value.__aenter__.return_value.post = AsyncMock(return_value=mock_resp)
+    client._client.post = AsyncMock(return_value=mock_resp)
 
-        result = await client.create_webhook_subscription(
-            webhook_url="https://example.com/webhook",
-            subscription_type="ticket.creation"
-        )
+    result = await client.create_webhook_subscription(
+        webhook_url="https://example.com/webhook",
+        subscription_type="ticket.creation"
+    )
 
-        assert result["id"] == "sub-123"
-        assert result["enabled"] is True
-        assert result["subscriptionType"] == "ticket.creation"
+    assert result["id"] == "sub-123"
+    assert result["enabled"] is True
+    assert result["subscriptionType"] == "ticket.creation"
 
 
 @pytest.mark.asyncio
@@ -254,13 +251,12 @@ async def test_get_tickets_with_pagination():
     }
 
     mock_resp = MagicMock()
-    mock_resp.json = MagicMock(return_value=mock_response)
+    mock_resp.content = orjson.dumps(mock_response)
     mock_resp.raise_for_status = MagicMock()
 
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_resp)
+    client._client.get = AsyncMock(return_value=mock_resp)
 
-        result = await client.get_tickets(limit=10, after="previous-cursor")
+    result = await client.get_tickets(limit=10, after="previous-cursor")
 
-        assert len(result["results"]) == 1
-        assert result["results"][0]["id"] == "789"
+    assert len(result["results"]) == 1
+    assert result["results"][0]["id"] == "789"
@@ -1,3 +1,6 @@
+import base64
+import json
+
 import pytest
 from unittest.mock import patch, MagicMock
 from fastapi import HTTPException
@@ -5,12 +8,25 @@ from fastapi.security import HTTPAuthorizationCredentials
 from src.core.auth import verify_firebase_token
 
 
+def _fake_token(subject: str) -> str:
+    """Build a structurally valid (but unsigned) RS256 token.
+
+    verify_firebase_token pre-checks token shape before calling Firebase,
+    so test tokens need three base64url segments and an RS256 header.
+    Distinct subjects produce distinct tokens, keeping cache keys apart.
+    """
+    header = base64.urlsafe_b64encode(b'{"alg":"RS256","typ":"JWT"}').rstrip(b"=").decode()
+    payload = base64.urlsafe_b64encode(json.dumps({"sub": subject}).encode()).rstrip(b"=").decode()
+    return f"{header}.{payload}.AAAA"
+
+
 @pytest.mark.asyncio
 async def test_verify_valid_token():
     """Test verifying a valid Firebase token."""
+    token = _fake_token("valid")
     mock_credentials = HTTPAuthorizationCredentials(
         scheme="Bearer",
-        credentials="valid-token"
+        credentials=token
     )
 
     with patch("src.core.auth.auth.verify_id_token") as mock_verify:
@@ -23,7 +39,7 @@ async def test_verify_valid_token():
 
         assert result["uid"] == "test-uid-123"
         assert result["email"] == "test@example.com"
-        mock_verify.assert_called_once_with("valid-token")
+        mock_verify.assert_called_once_with(token)
 
 
 @pytest.mark.asyncio
@@ -33,7 +49,7 @@ async def test_verify_invalid_token():
 
     mock_credentials = HTTPAuthorizationCredentials(
         scheme="Bearer",
-        credentials="invalid-token"
+        credentials=_fake_token("invalid")
     )
 
     with patch("src.core.auth.auth.verify_id_token") as mock_verify:
@@ -53,7 +69,7 @@ async def test_verify_expired_token():
 
     mock_credentials = HTTPAuthorizationCredentials(
         scheme="Bearer",
-        credentials="expired-token"
+        credentials=_fake_token("expired")
     )
 
     with patch("src.core.auth.auth.verify_id_token") as mock_verify:
@@ -72,7 +88,7 @@ async def test_verify_token_generic_error():
     """Test verifying a token with generic error."""
     mock_credentials = HTTPAuthorizationCredentials(
         scheme="Bearer",
-        credentials="error-token"
+        credentials=_fake_token("error")
     )
 
     with patch("src.core.auth.auth.verify_id_token") as mock_verify:
@@ -83,3 +99,45 @@ async def test_verify_token_generic_error():
 
         assert exc_info.value.status_code == 401
         assert "Authentication failed" in str(exc_info.value.detail)
+
+
+@pytest.mark.asyncio
+async def test_verify_malformed_token_rejected_before_firebase():
+    """Structurally invalid tokens are rejected without touching Firebase."""
+    for bad_token in ["not-a-jwt", "only.one", "x" * 5000]:
+        mock_credentials = HTTPAuthorizationCredentials(
+            scheme="Bearer",
+            credentials=bad_token
+        )
+
+        with patch("src.core.auth.auth.verify_id_token") as mock_verify:
+            with pytest.raises(HTTPException) as exc_info:
+                await verify_firebase_token(mock_credentials)
+
+            assert exc_info.value.status_code == 401
+            mock_verify.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_verify_token_cached_on_repeat():
+    """A warm token skips re-verification within the cache TTL."""
+    import time
+
+    token = _fake_token("repeat")
+    mock_credentials = HTTPAuthorizationCredentials(
+        scheme="Bearer",
+        credentials=token
+    )
+
+    with patch("src.core.auth.auth.verify_id_token") as mock_verify:
+        mock_verify.return_value = {
+            "uid": "repeat-uid",
+            "email": "repeat@example.com",
+            "exp": time.time() + 3600,
+        }
+
+        first = await verify_firebase_token(mock_credentials)
+        second = await verify_firebase_token(mock_credentials)
+
+        assert first == second
+        mock_verify.assert_called_once_with(token)
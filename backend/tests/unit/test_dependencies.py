@@ -111,3 +111,56 @@ async def test_require_admin_with_non_admin_user():
     # Assert
     assert exc_info.value.status_code == 403
     assert "Admin access required" in str(exc_info.value.detail)
+
+
+def test_get_user_by_firebase_uid_cache_hit_skips_db():
+    """A cached identity row is rebuilt without touching the database."""
+    from unittest.mock import patch
+    from src.api.dependencies import get_user_by_firebase_uid
+
+    cached = {
+        "id": str(uuid.uuid4()),
+        "tenant_id": str(uuid.uuid4()),
+        "firebase_uid": "cached-uid",
+        "email": "cached@example.com",
+        "name": "Cached User",
+        "role": "admin",
+    }
+    mock_db = MagicMock()
+
+    with patch("src.api.dependencies.cache_get_json", return_value=cached):
+        user = get_user_by_firebase_uid(mock_db, "cached-uid")
+
+    assert user.email == "cached@example.com"
+    assert user.role == UserRole.ADMIN
+    assert str(user.tenant_id) == cached["tenant_id"]
+    mock_db.query.assert_not_called()
+
+
+def test_get_user_by_firebase_uid_miss_queries_and_caches():
+    """A cache miss falls through to the ORM query and stores the row."""
+    from unittest.mock import patch
+    from src.api.dependencies import get_user_by_firebase_uid, USER_CACHE_TTL_SECONDS
+
+    mock_user = User(
+        id=uuid.uuid4(),
+        tenant_id=uuid.uuid4(),
+        firebase_uid="fresh-uid",
+        email="fresh@example.com",
+        name="Fresh User",
+        role=UserRole.MEMBER
+    )
+
+    mock_db = MagicMock()
+    mock_db.query.return_value.filter.return_value.first.return_value = mock_user
+
+    with patch("src.api.dependencies.cache_get_json", return_value=None), \
+         patch("src.api.dependencies.cache_set_json") as mock_set:
+        result = get_user_by_firebase_uid(mock_db, "fresh-uid")
+
+    assert result is mock_user
+    mock_set.assert_called_once()
+    key, payload, ttl = mock_set.call_args[0]
+    assert key == "user:fbuid:fresh-uid"
+    assert payload["role"] == "member"
+    assert ttl == USER_CACHE_TTL_SECONDS
@@ -3,6 +3,7 @@ Tests for model selection fallback behavior in OpenRouterAnalyzer.
 """
 
 import pytest
+import orjson
 from unittest.mock import patch, AsyncMock, MagicMock
 from src.services.openrouter import OpenRouterAnalyzer
 from src.core.config import settings
@@ -31,7 +32,7 @@ async def test_model_fallback_uses_env_var():
     }
 
     mock_response = MagicMock()
-    mock_response.json.return_value = mock_response_data
+    mock_response.content = orjson.dumps(mock_response_data)
     mock_response.raise_for_status = MagicMock()
 
     with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
@@ -76,7 +77,7 @@ async def test_explicit_model_overrides_everything():
     }
 
     mock_response = MagicMock()
-    mock_response.json.return_value = mock_response_data
+    mock_response.content = orjson.dumps(mock_response_data)
     mock_response.raise_for_status = MagicMock()
 
     with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
@@ -1,4 +1,5 @@
 import pytest
+import orjson
 import httpx
 from unittest.mock import patch, AsyncMock, MagicMock
 from tenacity import RetryError
@@ -31,7 +32,7 @@ async def test_analyze_ticket_with_topics():
 
     # Create a mock response object
     mock_response = MagicMock()
-    mock_response.json.return_value = mock_response_data
+    mock_response.content = orjson.dumps(mock_response_data)
     mock_response.raise_for_status = MagicMock()
 
     with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
@@ -73,7 +74,7 @@ async def test_analyze_ticket_without_topics():
 
     # Create a mock response object
     mock_response = MagicMock()
-    mock_response.json.return_value = mock_response_data
+    mock_response.content = orjson.dumps(mock_response_data)
     mock_response.raise_for_status = MagicMock()
 
     with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
@@ -123,7 +124,7 @@ async def test_analyze_ticket_malformed_json():
     }
 
     mock_response = MagicMock()
-    mock_response.json.return_value = mock_response_data
+    mock_response.content = orjson.dumps(mock_response_data)
     mock_response.raise_for_status = MagicMock()
 
     with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
@@ -139,3 +140,18 @@ async def test_analyze_ticket_malformed_json():
         assert exc_info.value.last_attempt.exception() is not None
         assert isinstance(exc_info.value.last_attempt.exception(), ValueError)
         assert "Failed to parse LLM response as JSON" in str(exc_info.value.last_attempt.exception())
+
+
+def test_prompt_identical_for_empty_and_none_topics():
+    """[] and None must both skip the configured-topics prompt branch."""
+    analyzer = OpenRouterAnalyzer(api_key="test-key")
+    prompt_data = analyzer._user_prompt_data
+
+    prompt_none = analyzer._build_analysis_prompt_from_template(
+        prompt_data, "Some ticket content", None, None
+    )
+    prompt_empty = analyzer._build_analysis_prompt_from_template(
+        prompt_data, "Some ticket content", [], []
+    )
+
+    assert prompt_none == prompt_empty
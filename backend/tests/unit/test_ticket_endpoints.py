@@ -157,21 +157,15 @@ async def test_import_tickets_generic_error(mock_db, test_user):
 @pytest.mark.asyncio
 async def test_list_tickets_all(mock_db, test_user, test_ticket):
     """Test listing all tickets."""
-    # Setup mock query chain
-    mock_query = MagicMock()
-    mock_subquery = MagicMock()
-    mock_count_result = MagicMock()
-    mock_count_result.scalar_one.return_value = 1
-
     # Mock the select statement and where clause
     with patch("src.api.routers.tickets.select") as mock_select, \
          patch("src.api.routers.tickets.func") as mock_func:
 
-        # Setup query result
+        # Setup query result: rows of (ticket, window-function total)
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [test_ticket]
+        mock_result.all.return_value = [(test_ticket, 1)]
 
-        mock_db.execute.side_effect = [mock_count_result, mock_result]
+        mock_db.execute.return_value = mock_result
 
         from src.api.routers.tickets import list_tickets
 
@@ -196,16 +190,13 @@ async def test_list_tickets_all(mock_db, test_user, test_ticket):
 @pytest.mark.asyncio
 async def test_list_tickets_with_sentiment_filter(mock_db, test_user, test_ticket):
     """Test listing tickets filtered by sentiment."""
-    mock_count_result = MagicMock()
-    mock_count_result.scalar_one.return_value = 1
-
     with patch("src.api.routers.tickets.select") as mock_select, \
          patch("src.api.routers.tickets.func") as mock_func:
 
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [test_ticket]
+        mock_result.all.return_value = [(test_ticket, 1)]
 
-        mock_db.execute.side_effect = [mock_count_result, mock_result]
+        mock_db.execute.return_value = mock_result
 
         from src.api.routers.tickets import list_tickets
 
@@ -225,16 +216,16 @@ async def test_list_tickets_with_sentiment_filter(mock_db, test_user, test_ticke
 @pytest.mark.asyncio
 async def test_list_tickets_with_pagination(mock_db, test_user):
     """Test listing tickets with pagination."""
-    mock_count_result = MagicMock()
-    mock_count_result.scalar_one.return_value = 100
-
     with patch("src.api.routers.tickets.select") as mock_select, \
          patch("src.api.routers.tickets.func") as mock_func:
 
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
+        mock_result.all.return_value = []
 
-        mock_db.execute.side_effect = [mock_count_result, mock_result]
+        mock_db.execute.return_value = mock_result
+        # A page past the end has no rows (so no window-function total);
+        # the endpoint falls back to a COUNT for the true total
+        mock_db.scalar.return_value = 100
 
         from src.api.routers.tickets import list_tickets
 
@@ -257,16 +248,13 @@ async def test_list_tickets_with_company_and_contact(mock_db, test_user, test_ti
     test_ticket.company = test_company
     test_ticket.contact = test_contact
 
-    mock_count_result = MagicMock()
-    mock_count_result.scalar_one.return_value = 1
-
     with patch("src.api.routers.tickets.select") as mock_select, \
          patch("src.api.routers.tickets.func") as mock_func:
 
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [test_ticket]
+        mock_result.all.return_value = [(test_ticket, 1)]
 
-        mock_db.execute.side_effect = [mock_count_result, mock_result]
+        mock_db.execute.return_value = mock_result
 
         from src.api.routers.tickets import list_tickets
 
@@ -292,16 +280,13 @@ async def test_list_tickets_with_company_and_contact(mock_db, test_user, test_ti
 @pytest.mark.asyncio
 async def test_list_tickets_empty_result(mock_db, test_user):
     """Test listing tickets when no tickets exist."""
-    mock_count_result = MagicMock()
-    mock_count_result.scalar_one.return_value = 0
-
     with patch("src.api.routers.tickets.select") as mock_select, \
          patch("src.api.routers.tickets.func") as mock_func:
 
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
+        mock_result.all.return_value = []
 
-        mock_db.execute.side_effect = [mock_count_result, mock_result]
+        mock_db.execute.return_value = mock_result
 
         from src.api.routers.tickets import list_tickets
 
@@ -334,16 +319,13 @@ async def test_list_tickets_without_sentiment(mock_db, test_user):
         external_url="https://app.hubspot.com/contacts/ticket/99999"
     )
 
-    mock_count_result = MagicMock()
-    mock_count_result.scalar_one.return_value = 1
-
     with patch("src.api.routers.tickets.select") as mock_select, \
          patch("src.api.routers.tickets.func") as mock_func:
 
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [ticket_without_sentiment]
+        mock_result.all.return_value = [(ticket_without_sentiment, 1)]
 
-        mock_db.execute.side_effect = [mock_count_result, mock_result]
+        mock_db.execute.return_value = mock_result
 
         from src.api.routers.tickets import list_tickets
 
@@ -371,16 +353,13 @@ async def test_list_tickets_limit_validation(mock_db, test_user):
     # Test with valid limits
     valid_limits = [1, 100, 500]
     for limit in valid_limits:
-        mock_count_result = MagicMock()
-        mock_count_result.scalar_one.return_value = 0
-
         with patch("src.api.routers.tickets.select") as mock_select, \
              patch("src.api.routers.tickets.func") as mock_func:
 
             mock_result = MagicMock()
-            mock_result.scalars.return_value.all.return_value = []
+            mock_result.all.return_value = []
 
-            mock_db.execute.side_effect = [mock_count_result, mock_result]
+            mock_db.execute.return_value = mock_result
 
             result = await list_tickets(
                 sentiment=None,